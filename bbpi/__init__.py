@@ -1,3 +1,8 @@
 from .bb1curve import BezierCurve
-from .bb1utilities import add, multiply, degree_raise, subdivide, integral, derivative
-from .bb2surface import BivariateBezierSurface
\ No newline at end of file
+from .bb1utilities import add, multiply, degree_raise, elevate, reduce_degree, subdivide, split_at, integral, derivative, flatten
+from .bb1calculus import hodograph, arc_length, arc_length_table, arc_length_parameter, sample_arc_length
+from .bb1batch import BezierCurveBatch
+from .bb1query import nearest_point, intersect, CurveBVH
+from .bb2surface import BivariateBezierSurface
+from .bbcache import basis_cache_info
+from .bbio import save_curves, load_curves, CurveLibrary, write_ply, write_obj
@@ -0,0 +1,25 @@
+"""
+Helpers for the optional heavy backends.
+
+SymPy and matplotlib are imported inside the functions that need them, so
+`import bbpi` only costs numpy. A value can only be a SymPy object if SymPy
+has already been imported by someone, which lets numeric code check for
+symbolic input without importing it.
+"""
+import sys
+
+
+def is_symbolic(x):
+    """
+    Returns True if x is a SymPy expression that is not a plain number
+    """
+    sympy = sys.modules.get('sympy')
+    return sympy is not None and isinstance(x, sympy.Basic) and not x.is_number
+
+
+def has_sympy(array):
+    """
+    Returns True if an object array holds any SymPy object, numbers included
+    """
+    sympy = sys.modules.get('sympy')
+    return sympy is not None and array.dtype == object and any(isinstance(x, sympy.Basic) for x in array.flat)
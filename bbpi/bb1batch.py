@@ -0,0 +1,187 @@
+import numpy as np
+from bbpi.bb1curve import BezierCurve, bernstein_matrix
+from bbpi.bb1utilities import product_weights, elevation_matrix, reduction_matrix, _split, _pieces
+from bbpi.bbcache import curve_basis_cache
+
+
+class BezierCurveBatch:
+    __slots__ = ('control_points',)
+
+    def __init__(self, control_points):
+        """
+        Initializes a batch of univariate bezier curves that share degree and dimension
+
+        Parameters:
+            control_points (list or np.ndarray): array of shape (n_curves, dimension, degree + 1).
+                A contiguous float64 array is used without copying.
+        """
+        if not isinstance(control_points, (list, np.ndarray)):
+            raise TypeError(f"Control points must be a list or a numpy array. Found {type(control_points)}")
+
+        self.control_points = np.ascontiguousarray(control_points, dtype=np.float64)
+
+        if self.control_points.ndim != 3:
+            raise ValueError(f"control points must have shape (n_curves, dimension, degree + 1), found {self.control_points.shape}")
+
+    @classmethod
+    def from_curves(cls, curves):
+        """
+        Stacks a sequence of BezierCurve objects into a batch
+
+        Parameters:
+            curves (list): BezierCurve objects of equal degree and dimension
+        Returns:
+            BezierCurveBatch
+        """
+        curves = list(curves)
+        if not curves:
+            raise ValueError("cannot build a batch from an empty sequence of curves")
+        degree, dimension = curves[0].degree, curves[0].dimension
+        for curve in curves:
+            if curve.degree != degree or curve.dimension != dimension:
+                raise ValueError(f"all curves must have degree {degree} and dimension {dimension}, found {curve.degree} and {curve.dimension}")
+        return cls(np.stack([curve.control_points for curve in curves]))
+
+    def to_curves(self):
+        """
+        Splits the batch into numeric BezierCurve objects that view the batch storage
+
+        Returns:
+            list of BezierCurve
+        """
+        return [BezierCurve(points, numeric=True) for points in self.control_points]
+
+    @property
+    def degree(self):
+        return self.control_points.shape[2] - 1
+
+    @property
+    def dimension(self):
+        return self.control_points.shape[1]
+
+    def __len__(self):
+        return self.control_points.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return BezierCurve(self.control_points[index], numeric=True)
+        return BezierCurveBatch(self.control_points[index])
+
+    def _check_compatible(self, other):
+        if self.control_points.shape[:2] != other.control_points.shape[:2]:
+            raise ValueError(f"batches do not match: {self.control_points.shape[:2]} and {other.control_points.shape[:2]} (n_curves, dimension)")
+
+    def evaluate(self, t):
+        """
+        Evaluates every curve of the batch at the parameter values t
+
+        Parameters:
+            t (float or np.ndarray): scalar or 1-D array of parameter values
+        Returns:
+            np.ndarray of shape (n_curves, dimension, len(t))
+        """
+        t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+        if t.ndim != 1:
+            raise ValueError(f"t must be a scalar or a 1-D array, found {t.ndim} dimensions")
+        return self.control_points @ curve_basis_cache.lookup(self.degree, (t,), bernstein_matrix).T
+
+    def add(self, other):
+        """
+        Adds the coefficients of two batches curve by curve, elevating the batch of lower degree first
+
+        Returns:
+            BezierCurveBatch
+        """
+        self._check_compatible(other)
+        a, b = self.control_points, other.control_points
+        if self.degree < other.degree:
+            a = a @ elevation_matrix(self.degree, other.degree - self.degree)
+        elif other.degree < self.degree:
+            b = b @ elevation_matrix(other.degree, self.degree - other.degree)
+        return BezierCurveBatch(a + b)
+
+    def multiply(self, other):
+        """
+        Multiplies two batches curve by curve in BB-form
+
+        Returns:
+            BezierCurveBatch of degree self.degree + other.degree
+        """
+        self._check_compatible(other)
+        a = self.control_points
+        b = other.control_points
+        outer = (a[..., :, None] * b[..., None, :]).reshape(a.shape[:2] + (-1,))
+        return BezierCurveBatch(outer @ product_weights(self.degree, other.degree))
+
+    def elevate(self, r=1):
+        """
+        Elevates the degree of every curve of the batch by r in one matrix product
+
+        Returns:
+            BezierCurveBatch of degree self.degree + r
+        """
+        if r < 0:
+            raise ValueError(f"cannot elevate by {r} degrees, use reduce_degree to lower the degree")
+        return BezierCurveBatch(self.control_points @ elevation_matrix(self.degree, r))
+
+    def reduce_degree(self, r=1):
+        """
+        Least-squares degree reduction of every curve of the batch, see bb1utilities.reduce_degree
+
+        Returns:
+            BezierCurveBatch of degree self.degree - r
+        """
+        if not 0 <= r <= self.degree:
+            raise ValueError(f"cannot reduce a batch of degree {self.degree} by {r} degrees")
+        return BezierCurveBatch(self.control_points @ reduction_matrix(self.degree, r))
+
+    def degree_raise(self):
+        """
+        Raises the degree of every curve of the batch by 1
+
+        Returns:
+            BezierCurveBatch
+        """
+        return self.elevate(1)
+
+    def subdivide(self, s=0.5):
+        """
+        Subdivides every curve of the batch with de Casteljau's algorithm
+
+        Parameters:
+            s (float or np.ndarray): split parameter, either shared or one per curve
+        Returns:
+            (BezierCurveBatch, BezierCurveBatch): the left and right pieces
+        """
+        s = np.asarray(s, dtype=np.float64)
+        if s.ndim:
+            s = s.reshape(-1, 1, 1)
+        b_local = self.control_points.copy()
+        bl = np.empty_like(b_local)
+        br = np.empty_like(b_local)
+        _split(b_local, s, bl, br)
+        return BezierCurveBatch(bl), BezierCurveBatch(br)
+
+    def split_at(self, ts):
+        """
+        Splits every curve of the batch at several parameters at once
+
+        Parameters:
+            ts (np.ndarray): non-decreasing split parameters, shape (m,) shared by all curves
+                or (len(self), m) for one row per curve
+        Returns:
+            list of m + 1 BezierCurveBatch, piece k of every curve in batch k
+        """
+        return [BezierCurveBatch(piece) for piece in _pieces(self.control_points, ts)]
+
+    def derivative(self):
+        """
+        Computes the derivative of every curve of the batch
+
+        Returns:
+            BezierCurveBatch of degree max(self.degree - 1, 0), the zero curves for degree 0
+        """
+        if self.degree == 0:
+            return BezierCurveBatch(np.zeros_like(self.control_points))
+        return BezierCurveBatch(self.degree * np.diff(self.control_points, axis=2))
+
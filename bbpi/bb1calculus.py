@@ -0,0 +1,201 @@
+from fractions import Fraction
+from functools import lru_cache
+import numpy as np
+from bbpi.bb1curve import BezierCurve, bernstein_matrix
+from bbpi.bbcache import curve_basis_cache
+
+
+def _derived(curve):
+    """
+    Per-curve cache of derived data, dropped whenever the control points are replaced or modified
+    """
+    if curve._derived is None:
+        curve._derived = {}
+    return curve._derived
+
+
+def hodograph(curve, k=1):
+    """
+    Control points of the k-th derivative of a Bezier curve
+
+    The chain of derivatives is computed once and cached on the curve, so asking for the
+    first and then the second derivative differentiates only twice. The derivative of a
+    degree 0 curve is the zero curve of degree 0.
+
+    Parameters:
+        curve (BezierCurve): the curve, left unchanged
+        k (int): order of the derivative, 0 for the control points themselves
+    Returns:
+        read-only np.ndarray of shape (dimension, max(degree - k, 0) + 1)
+    """
+    if k < 0:
+        raise ValueError(f"derivative order must be non-negative, found {k}")
+    if k == 0:
+        return curve.control_points
+
+    cache = _derived(curve)
+    key = ('hodograph', k)
+    if key not in cache:
+        points = hodograph(curve, k - 1)
+        dg = points.shape[1] - 1
+        points = dg * np.diff(points, axis=1) if dg > 0 else np.zeros_like(points)
+        points.setflags(write=False)
+        cache[key] = points
+    return cache[key]
+
+
+def integral(curve, constant=0):
+    """
+    Antiderivative of a Bezier curve in Bernstein form
+
+    The antiderivative of a degree n curve with coefficients b_i has degree n + 1 and
+    coefficients c_0 = constant, c_i+1 = c_i + b_i / (n + 1). Its value at t = 1 minus
+    constant is the integral of the curve over [0, 1]. Object coefficients (symbols,
+    Fractions) stay exact.
+
+    Parameters:
+        curve (BezierCurve): the curve to integrate
+        constant (scalar or sequence): value of the antiderivative at t = 0, per dimension or shared
+    Returns:
+        BezierCurve of degree curve.degree + 1
+    """
+    points = curve.control_points
+    if points.dtype == object:
+        steps = points * Fraction(1, curve.degree + 1)
+    else:
+        steps = points.astype(np.float64) / (curve.degree + 1)
+
+    start = np.zeros((curve.dimension, 1), dtype=steps.dtype)
+    start[:] = np.reshape(constant, (-1, 1)) if np.ndim(constant) else constant
+    return BezierCurve(np.concatenate([start, start + np.cumsum(steps, axis=1)], axis=1), numeric=curve.numeric)
+
+
+@lru_cache(maxsize=32)
+def gauss_legendre(order):
+    """
+    Gauss-Legendre nodes and weights of the given order mapped to [0, 1]
+
+    Returns:
+        (np.ndarray, np.ndarray): read-only nodes and weights
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    nodes = (nodes + 1) / 2
+    weights = weights / 2
+    nodes.setflags(write=False)
+    weights.setflags(write=False)
+    return nodes, weights
+
+
+def _speed(curve, t, cached=False):
+    """
+    Norm of the first derivative at the flat parameter array t. Only fixed grids, like the
+    table knots shared by all curves of a degree, should go through the basis cache.
+    """
+    points = hodograph(curve).astype(np.float64, copy=False)
+    if cached:
+        basis = curve_basis_cache.lookup(points.shape[1] - 1, (t,), bernstein_matrix)
+    else:
+        basis = bernstein_matrix(points.shape[1] - 1, t)
+    return np.linalg.norm(points @ basis.T, axis=0)
+
+
+def arc_length(curve, t=1.0, order=8, segments=8):
+    """
+    Arc length of a Bezier curve from 0 to t with composite Gauss-Legendre quadrature
+
+    All quadrature nodes of all the upper limits are evaluated in one matrix product.
+
+    Parameters:
+        curve (BezierCurve): the curve
+        t (float or np.ndarray): upper limit(s) of integration
+        order (int): number of Gauss-Legendre nodes per segment
+        segments (int): number of equal segments [0, t] is divided into
+    Returns:
+        float or np.ndarray of the shape of t
+    """
+    t = np.asarray(t, dtype=np.float64)
+    flat = t.reshape(-1)
+    nodes, weights = gauss_legendre(order)
+    x = ((np.arange(segments)[:, None] + nodes) / segments).ravel()
+    params = flat[:, None] * x
+    speed = _speed(curve, params.ravel()).reshape(params.shape)
+    lengths = (flat * (speed @ np.tile(weights, segments)) / segments).reshape(t.shape)
+    return lengths[()] if lengths.ndim == 0 else lengths
+
+
+def _arc_table(curve, size, order):
+    """
+    Cached (t, s, speed) knots of the arc length table, see arc_length_table
+    """
+    cache = _derived(curve)
+    key = ('arc_length', size, order)
+    if key not in cache:
+        t = np.linspace(0, 1, size + 1)
+        nodes, weights = gauss_legendre(order)
+        x = (t[:-1, None] + nodes / size).ravel()
+        pieces = _speed(curve, x, cached=True).reshape(size, order) @ weights / size
+        s = np.concatenate([[0.0], np.cumsum(pieces)])
+        speed = _speed(curve, t, cached=True)
+        for array in (t, s, speed):
+            array.setflags(write=False)
+        cache[key] = (t, s, speed)
+    return cache[key]
+
+
+def arc_length_table(curve, size=256, order=8):
+    """
+    Arc length at size + 1 uniformly spaced parameters, each interval integrated with
+    Gauss-Legendre quadrature. The table is cached on the curve.
+
+    Parameters:
+        curve (BezierCurve): the curve
+        size (int): number of table intervals
+        order (int): number of Gauss-Legendre nodes per interval
+    Returns:
+        (np.ndarray, np.ndarray): read-only parameters t and arc lengths s, s[-1] being the length of the curve
+    """
+    t, s, _ = _arc_table(curve, size, order)
+    return t, s
+
+
+def arc_length_parameter(curve, s, size=256, order=8):
+    """
+    Parameters at which the curve reaches the arc lengths s
+
+    Inverts the arc length table with monotone cubic Hermite interpolation, using
+    dt/ds = 1 / speed at the table knots, so no root finding is needed per query.
+
+    Parameters:
+        curve (BezierCurve): the curve
+        s (float or np.ndarray): arc lengths from the start of the curve, clipped to [0, length]
+        size (int): number of table intervals, see arc_length_table
+        order (int): number of Gauss-Legendre nodes per table interval
+    Returns:
+        float or np.ndarray of the shape of s
+    """
+    knots, lengths, speed = _arc_table(curve, size, order)
+    s = np.clip(np.asarray(s, dtype=np.float64), 0, lengths[-1])
+    k = np.clip(np.searchsorted(lengths, s, side='right') - 1, 0, size - 1)
+
+    h = lengths[k + 1] - lengths[k]
+    dt = knots[k + 1] - knots[k]
+    x = np.divide(s - lengths[k], h, out=np.zeros_like(s), where=h > 0)
+    # tangents in units of the interval, limited to 3 dt to keep the interpolant monotone
+    m0 = np.minimum(np.divide(h, speed[k], out=np.full_like(s, np.inf), where=speed[k] > 0), 3 * dt)
+    m1 = np.minimum(np.divide(h, speed[k + 1], out=np.full_like(s, np.inf), where=speed[k + 1] > 0), 3 * dt)
+
+    x2 = x * x
+    x3 = x2 * x
+    t = knots[k] + (3 * x2 - 2 * x3) * dt + (x3 - 2 * x2 + x) * m0 + (x3 - x2) * m1
+    return t[()] if t.ndim == 0 else t
+
+
+def sample_arc_length(curve, n=100, size=256, order=8):
+    """
+    Samples a curve at n points equally spaced along its arc length, for constant-speed traversal
+
+    Returns:
+        np.ndarray of shape (dimension, n)
+    """
+    _, lengths = arc_length_table(curve, size, order)
+    return curve.evaluate(arc_length_parameter(curve, np.linspace(0, lengths[-1], n), size, order))
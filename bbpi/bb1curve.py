@@ -1,62 +1,334 @@
-from sympy import symbols, factorial, binomial
+from functools import lru_cache
+from itertools import islice
+from math import comb
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+from ._lazy import is_symbolic
+from .bbcache import curve_basis_cache, SampleCache
+from .bbprofile import instrumented
 
 
+def bernstein_matrix(degree, t):
+    """
+    Builds the numeric Bernstein basis matrix for a batch of parameters
+
+    Parameters:
+        degree (int): degree of the basis
+        t (np.ndarray): 1-D array of parameter values
+    Returns:
+        np.ndarray of shape (len(t), degree + 1) where entry [k, i] is B_i^degree(t[k])
+    """
+    t = np.asarray(t, dtype=np.float64).reshape(-1, 1)
+    i = np.arange(degree + 1)
+    coefficients = np.array([comb(degree, k) for k in i], dtype=np.float64)
+    return coefficients * t**i * (1 - t)**(degree - i)
+
+
+def iter_chunks(source, chunk_size):
+    """
+    Splits a parameter source into consecutive float64 chunks of at most chunk_size values
+
+    Parameters:
+        source (np.ndarray, np.memmap or iterable): the parameter values. Arrays are sliced,
+            so a float64 memmap is read one chunk at a time without copying it whole.
+        chunk_size (int): number of values per chunk
+    Yields:
+        (start, chunk): offset of the chunk in the source and the chunk itself
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, found {chunk_size}")
+    if isinstance(source, np.ndarray):
+        source = source.reshape(-1)
+        for start in range(0, source.shape[0], chunk_size):
+            yield start, np.asarray(source[start:start + chunk_size], dtype=np.float64)
+        return
+
+    iterator = iter(source)
+    start = 0
+    while True:
+        chunk = np.fromiter(islice(iterator, chunk_size), dtype=np.float64)
+        if chunk.shape[0] == 0:
+            return
+        yield start, chunk
+        start += chunk.shape[0]
+
+
+def de_casteljau(points, t):
+    """
+    Evaluates a curve at many parameters at once with de Casteljau's algorithm
+
+    Parameters:
+        points (np.ndarray): coefficient array of shape (dimension, degree + 1)
+        t (np.ndarray): 1-D array of parameter values
+    Returns:
+        np.ndarray of shape (dimension, len(t))
+    """
+    t = np.asarray(t, dtype=np.float64)
+    work = np.repeat(np.asarray(points, dtype=np.float64)[:, :, None], t.shape[0], axis=2)
+    for l in range(1, work.shape[1]):
+        work[:, :-l] = (1 - t) * work[:, :-l] + t * work[:, 1:work.shape[1] - l + 1]
+    return work[:, 0]
+
+
+@lru_cache(maxsize=64)
+def power_matrix(degree):
+    """
+    Change of basis from Bernstein to monomial coefficients
+
+    Parameters:
+        degree (int): degree of the polynomials
+    Returns:
+        read-only integer-valued float64 array M of shape (degree + 1, degree + 1) such that
+        the monomial coefficients of a curve are control_points @ M.T, with
+        M[k, i] = C(degree, k) C(k, i) (-1)^(k - i) for i <= k
+    """
+    matrix = np.zeros((degree + 1, degree + 1))
+    for k in range(degree + 1):
+        for i in range(k + 1):
+            matrix[k, i] = comb(degree, k) * comb(k, i) * (-1)**(k - i)
+    matrix.setflags(write=False)
+    return matrix
+
+
+# the monomial form loses accuracy quickly with the degree, above this sample_uniform uses de Casteljau
+_HORNER_MAX_DEGREE = 12
+# relative error against de Casteljau above which sample_uniform discards the Horner samples
+_HORNER_TOLERANCE = 1e-10
+
 
 class BezierCurve:
-    def __init__(self, control_points, var='b'):
+    __slots__ = ('_control_points', 'degree', 'dimension', 'numeric', '_var', '_b', '_symbolic', '_samples', '_derived')
+
+    def __init__(self, control_points, var='b', numeric=False):
         """
         Initializes a univariate bezier curve with the given control points
         
         Parameters:
             control_points (list): A list representing the control points of a bezier curve
+            var (str): prefix of the symbolic coefficient names in self.b
+            numeric (bool): store the control points as a single contiguous float64 array.
+                An array that already has that layout is used without copying.
         """
         # Ensure control_points is a list or a numpy array
         if not isinstance(control_points, (list, np.ndarray)):
             raise TypeError(f"Control points must be a list or a numpy array. Found {type(control_points)}")
         
-        self.control_points = np.atleast_2d(np.array(control_points))
+        self.numeric = numeric
+        self._var = var
+        if numeric:
+            self.control_points = np.atleast_2d(np.ascontiguousarray(control_points, dtype=np.float64))
+        else:
+            self.control_points = np.atleast_2d(np.array(control_points))
 
         if self.control_points.ndim > 3:
             raise ValueError(f"control points cannot have more than 3 rows, found {self.control_points.ndim}")
-        
-        self.degree = self.control_points.shape[1]-1
-        self.dimension = self.control_points.shape[0]
 
-        if self.control_points.shape[0] > 1:
-            self.b = [[symbols(f'{var}_{i}_{j}') for j in range(self.degree + 1)] for i in range(self.control_points.shape[0])]
-        else:
-            self.b = [[symbols(f'{var}_{i}') for i in range(self.degree+1)]]
+    @property
+    def control_points(self):
+        """
+        Read-only view of the coefficient array of shape (dimension, degree + 1), one column
+        per control point. Edit through modify_control_point or assign a new array, so the
+        compiled, sampled and derived data follow the change.
+        """
+        view = self._control_points.view()
+        view.flags.writeable = False
+        return view
+
+    @control_points.setter
+    def control_points(self, points):
+        # replacing the coefficients invalidates everything derived from them
+        self._control_points = points
+        self.degree = points.shape[1]-1
+        self.dimension = points.shape[0]
+        self._b = None
+        self._symbolic = None
+        self._samples = None
+        self._derived = None
+
+    def __getstate__(self):
+        # compiled closures do not pickle and the caches are rebuilt on demand
+        return {'control_points': self._control_points, 'numeric': self.numeric, 'var': self._var}
 
+    def __setstate__(self, state):
+        self.numeric = state['numeric']
+        self._var = state['var']
+        self.control_points = state['control_points']
+
+    @property
+    def b(self):
+        """
+        Symbolic coefficients of the curve, one symbol per control coefficient.
+        They are only needed for symbolic products, so they are created on first access.
+        """
+        if self._b is None:
+            from sympy import symbols
+            var = self._var
+            if self.control_points.shape[0] > 1:
+                self._b = [[symbols(f'{var}_{i}_{j}') for j in range(self.degree + 1)] for i in range(self.control_points.shape[0])]
+            else:
+                self._b = [[symbols(f'{var}_{i}') for i in range(self.degree+1)]]
+        return self._b
 
     def basis(self, i , u):
         """
         Initializes the bernstein basis in the univariate form
 
         Parameters:
-            u (symbol): representing the variable in the basis function
+            u (symbol or float): representing the variable in the basis function
             i (integer): the index of the basis function
         Returns:
-            symbolic representation of the basis function at index i
+            symbolic representation of the basis function at index i, or its value for a numeric u
         """
         
         j = self.degree - i
+        if not is_symbolic(u):
+            return comb(self.degree, i) * (1 - u)**j * u**i
+
+        from sympy import factorial
         b = (factorial(self.degree) / (factorial(j) * factorial(i))) * (1 - u)**j * u**i
         return b
 
     
-    def evaluate(self, t = symbols('u')):
+    @instrumented('BezierCurve.evaluate', lambda self, t=None: {
+        'degree': self.degree, 'dimension': self.dimension, 'samples': 0 if t is None else np.size(t)})
+    def evaluate(self, t=None):
         """
-        Evaluates the Bezier curve at parameter t using the De Casteljau's algorithm.
+        Evaluates the Bezier curve at parameter t.
+
+        Numeric parameters (a float or a 1-D array of floats) are evaluated in a single
+        matrix product against the Bernstein basis. A SymPy symbol, or symbolic control
+        points, go through the symbolic basis instead.
 
         Parameters:
-            t (float): The parameter value (typically between 0 and 1).
+            t (float, np.ndarray or symbol): The parameter value(s) (typically between 0 and 1).
+                Defaults to the symbol u.
 
         Returns:
-            np.array: The point on the Bezier curve corresponding to the parameter t.
+            np.array: array of shape (dimension, len(t)) with one column per parameter value.
+        """
+        if t is None:
+            from sympy import symbols
+            t = symbols('u')
+        if is_symbolic(t) or self.control_points.dtype == object:
+            return self._evaluate_symbolic(t)
+
+        return self.control_points.astype(np.float64, copy=False) @ self.basis_matrix(t).T
+
+    def iter_evaluate(self, t_source, chunk_size=1 << 16, out=None):
+        """
+        Evaluates the curve over a large parameter source one chunk at a time, so memory
+        stays bounded by chunk_size no matter how many parameters there are.
+
+        Parameters:
+            t_source (np.ndarray, np.memmap or iterable): parameter values
+            chunk_size (int): number of parameters evaluated per step
+            out (np.ndarray or np.memmap, optional): array of shape (dimension, n) that the
+                results are written into directly; its column views are yielded
+        Yields:
+            np.ndarray of shape (dimension, chunk length) for each chunk
         """
+        points = self.control_points.astype(np.float64, copy=False)
+        for start, t in iter_chunks(t_source, chunk_size):
+            basis = bernstein_matrix(self.degree, t).T
+            if out is None:
+                yield points @ basis
+            else:
+                target = out[:, start:start + t.shape[0]]
+                if target.shape[1] != t.shape[0]:
+                    raise ValueError(f"out has {out.shape[1]} columns, the source has more parameters")
+                np.matmul(points, basis, out=target)
+                yield target
+
+    def sample_uniform(self, n=100):
+        """
+        Samples the curve at n uniformly spaced parameters in [0, 1].
+
+        The control points are converted to monomial coefficients once and all samples are
+        produced together by Horner's rule, O(n * degree) with no basis matrix. The result
+        is checked against de Casteljau's algorithm at a few samples; above degree 12, or
+        if the check fails, the samples come from de Casteljau's algorithm instead.
+
+        Parameters:
+            n (int): number of samples
+        Returns:
+            np.ndarray of shape (dimension, n)
+        """
+        t = np.linspace(0, 1, n)
+        if self.control_points.dtype == object:
+            return self.evaluate(t)
+        points = self.control_points.astype(np.float64, copy=False)
+        if n == 0:
+            return np.empty((self.dimension, 0))
+        if self.degree > _HORNER_MAX_DEGREE:
+            return de_casteljau(points, t)
+
+        coefficients = points @ power_matrix(self.degree).T
+        out = np.repeat(coefficients[:, -1:], n, axis=1)
+        for k in range(self.degree - 1, -1, -1):
+            out *= t
+            out += coefficients[:, k:k + 1]
+
+        check = np.unique(np.linspace(0, n - 1, min(n, 5)).astype(int))
+        scale = max(np.abs(points).max(), np.finfo(np.float64).tiny)
+        if np.abs(out[:, check] - de_casteljau(points, t[check])).max() > _HORNER_TOLERANCE * scale:
+            return de_casteljau(points, t)
+        return out
+
+    def sample(self, num_points=100):
+        """
+        Samples the curve at num_points uniformly spaced parameters in [0, 1].
+
+        The samples are cached per num_points. modify_control_point updates every cached
+        buffer in place by adding the change of the control point times its basis column,
+        which costs O(num_points) per edit instead of a full re-evaluation.
+
+        Parameters:
+            num_points (int): number of samples
+        Returns:
+            read-only np.ndarray of shape (dimension, num_points)
+        """
+        if self.control_points.dtype == object:
+            return self.evaluate(np.linspace(0, 1, num_points))
+        if self._samples is None:
+            self._samples = SampleCache()
+
+        def build():
+            basis = self.basis_matrix(np.linspace(0, 1, num_points))
+            return basis, self.control_points.astype(np.float64) @ basis.T
+        return self._samples.get(num_points, build)
+
+    def _update_samples(self, index, delta):
+        """
+        Applies the change delta of control point index to the cached sample buffers
+        """
+        def increment(basis, buffer):
+            buffer += np.outer(delta, basis[:, index])
+
+        def resync(basis, buffer):
+            np.matmul(self.control_points.astype(np.float64), basis.T, out=buffer)
+        self._samples.update(increment, resync)
+
+    def basis_matrix(self, t):
+        """
+        Numeric Bernstein basis of the curve's degree sampled at t, shared through a
+        bounded cache keyed by degree and grid (see bbpi.bbcache.curve_basis_cache)
+
+        Parameters:
+            t (float or np.ndarray): scalar or 1-D array of parameter values
+        Returns:
+            read-only np.ndarray of shape (len(t), degree + 1)
+        """
+        t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+        if t.ndim != 1:
+            raise ValueError(f"t must be a scalar or a 1-D array, found {t.ndim} dimensions")
+        return curve_basis_cache.lookup(self.degree, (t,), bernstein_matrix)
+
+    def _evaluate_symbolic(self, t):
+        """
+        Evaluates the Bezier curve through the symbolic Bernstein basis.
+        """
+        if is_symbolic(t):
+            return np.array([[expression] for expression in self.expression(t)])
+
         point = [0] * self.control_points.shape[0]
         
         points = np.array(self.control_points)
@@ -66,9 +338,63 @@ class BezierCurve:
             for j, element in enumerate(row):
                 p[0] +=  element * self.basis(j,t)
             point[i] = p 
-        
+
         return np.array(point).astype(np.float64)
 
+    def _cache(self, t):
+        """
+        Returns the per-symbol cache entry [expressions, compiled function], creating it if needed
+        """
+        if self._symbolic is None:
+            self._symbolic = {}
+        return self._symbolic.setdefault(t, [None, None])
+
+    def expression(self, t=None):
+        """
+        Symbolic polynomial of every coordinate of the curve in the variable t. The expressions
+        are built once per variable and kept until the control points change.
+
+        Parameters:
+            t (symbol): the curve parameter, the symbol u by default
+        Returns:
+            list of sympy expressions, one per dimension
+        """
+        from sympy import symbols
+        t = symbols('u') if t is None else t
+        entry = self._cache(t)
+        if entry[0] is None:
+            basis = [self.basis(j, t) for j in range(self.degree + 1)]
+            entry[0] = [sum(element * b for element, b in zip(row, basis)) for row in self.control_points]
+        return entry[0]
+
+    def compile(self, t=None):
+        """
+        Compiles the symbolic polynomial of the curve into a vectorized NumPy function.
+        The function is built once per variable and kept until the control points change.
+
+        Parameters:
+            t (symbol): the curve parameter, the symbol u by default
+        Returns:
+            callable f(t_values, *values) returning an array of shape (dimension, len(t_values)),
+            where values are assigned to the free symbols of the control points sorted by name
+        """
+        from sympy import symbols, lambdify
+        t = symbols('u') if t is None else t
+        entry = self._cache(t)
+        if entry[1] is None:
+            expressions = self.expression(t)
+            free = sorted(set().union(*(e.free_symbols for e in expressions if hasattr(e, 'free_symbols'))) - {t}, key=str)
+            function = lambdify([t] + free, expressions, 'numpy')
+
+            def compiled(t_values, *values):
+                t_values = np.atleast_1d(np.asarray(t_values, dtype=np.float64))
+                # constant coordinates come back as scalars, broadcast them over t
+                return np.array([np.broadcast_to(row, t_values.shape) for row in function(t_values, *values)], dtype=np.float64)
+
+            compiled.symbols = free
+            entry[1] = compiled
+        return entry[1]
+
     def plot(self, num_points=100, grid=True, fig=(8,6)):
         """
         Plots the Bezier curve using matplotlib.
@@ -77,11 +403,12 @@ class BezierCurve:
             num_points (int): Number of points on the curve to calculate for plotting.
         """
         if self.control_points.shape[0] >= 2:
-            t_values = np.linspace(0, 1, num_points)
-            curve_points = np.array([self.evaluate(t) for t in t_values])
+            import matplotlib.pyplot as plt
+
+            curve_points = self.sample(num_points)
             
             plt.figure(figsize=fig)
-            plt.plot(curve_points[:,0], curve_points[:,1], label="Bezier Curve")
+            plt.plot(curve_points[0], curve_points[1], label="Bezier Curve")
             plt.scatter(self.control_points[0, :], self.control_points[1, :], color='red', label="Control Points")
             plt.plot(self.control_points[0, :], self.control_points[1, :], 'r--', label="Control Polygon")
             plt.legend()
@@ -92,20 +419,21 @@ class BezierCurve:
             plt.show()
 
     def plot3D(self, num_points=100, f=111, color='r', mark='o', xlabel='X coordinate', ylabel='Y coordinate', zlabel='Z coordinate', cp = True, crve = True):
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D  # registers the 3d projection
+
         fig = plt.figure()
         ax = fig.add_subplot(f, projection='3d')
         
         if self.control_points.shape[0] != 3:
             raise ValueError(f"wrong dimension, needed 3 found {self.control_points.shape[0]}")
 
-        t_values = np.linspace(0, 1, num_points)
-        print(type(self.control_points))
-        curve_points = np.array([self.evaluate(t) for t in t_values])
+        curve_points = self.sample(num_points)
         if(cp == True):
             ax.scatter3D(self.control_points[0, :], self.control_points[1, :], self.control_points[2, :], c=color, marker=mark)
 
         if(crve == True):
-            ax.plot(curve_points[:,0],curve_points[:,1],curve_points[:,2])
+            ax.plot(curve_points[0],curve_points[1],curve_points[2])
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
         ax.set_zlabel(zlabel)
@@ -117,13 +445,13 @@ class BezierCurve:
 
     def add_control_point(self, point):
         """
-        Adds a new control point to the Bezier curve.
+        Adds a new control point to the end of the Bezier curve, raising its degree by one.
 
         Parameters:
-            point integer: A tuple (x, y) representing the new control point to be added.
+            point (tuple): A tuple (x, y) with one coordinate per dimension.
         """
-        #TODO fix adding
-        self.control_points = np.vstack([self.control_points, point])
+        point = np.reshape(np.asarray(point), (self.dimension, 1))
+        self.control_points = np.hstack([self.control_points, point])
 
     def modify_control_point(self, index, new_point):
         """
@@ -133,7 +461,16 @@ class BezierCurve:
             index (int): The index of the control point to modify.
             new_point (tuple): A tuple (x, y) representing the new value of the control point.
         """
-        if 0 <= index < len(self.control_points):
-            self.control_points[index] = new_point
+        if 0 <= index <= self.degree:
+            dtype = np.result_type(self._control_points, np.asarray(new_point))
+            if dtype != self._control_points.dtype:
+                # e.g. a float written into coefficients built from ints
+                self._control_points = self._control_points.astype(dtype)
+            old = self._control_points[:, index].copy()
+            self._control_points[:, index] = new_point
+            self._symbolic = None
+            self._derived = None
+            if self._samples:
+                self._update_samples(index, (self.control_points[:, index] - old).astype(np.float64))
         else:
             raise IndexError("Control point index is out of range.")
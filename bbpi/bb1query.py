@@ -0,0 +1,414 @@
+import heapq
+from math import comb
+import numpy as np
+from bbpi.bb1utilities import _split
+
+
+def _hodographs(points):
+    """
+    Precomputes a (dimension, degree + 1) coefficient array and its first two derivatives,
+    each scaled by its binomial row, for repeated evaluation at single parameters
+    """
+    out = []
+    for _ in range(3):
+        dg = points.shape[1] - 1
+        out.append((points * [comb(dg, i) for i in range(dg + 1)], np.arange(dg + 1)))
+        points = dg * np.diff(points, axis=1) if dg > 0 else np.zeros_like(points)
+    return out
+
+
+def _evaluate(hodographs, t):
+    """
+    Evaluates a curve and its first two derivatives at a scalar t from its precomputed hodographs
+    """
+    return [scaled @ (t**i * (1 - t)**(i[-1] - i)) for scaled, i in hodographs]
+
+
+def _box_distance(lo, hi, point):
+    """
+    Distance from a point to an axis aligned box, 0 inside the box
+    """
+    return np.linalg.norm(np.maximum(lo - point, 0) + np.maximum(point - hi, 0))
+
+
+def _halves(points):
+    left = np.empty_like(points)
+    right = np.empty_like(points)
+    _split(points.copy(), 0.5, left, right)
+    return left, right
+
+
+def _refine_nearest(hodographs, point, t, t0, t1, tol, iterations=20):
+    """
+    Newton iteration on (C(t) - p) . C'(t) = 0, kept inside [t0, t1]
+    """
+    for _ in range(iterations):
+        value, d1, d2 = _evaluate(hodographs, t)
+        offset = value - point
+        g = offset @ d1
+        dg = d1 @ d1 + offset @ d2
+        if dg <= 0:
+            break
+        step = t - min(max(t - g / dg, t0), t1)
+        t -= step
+        if abs(step) <= tol:
+            break
+    return t
+
+
+def nearest_point(curve, point, tol=1e-9, max_depth=40):
+    """
+    Finds the point of a Bezier curve closest to a given point.
+
+    The curve is cut into halves with de Casteljau's algorithm; a piece is skipped when
+    the bounding box of its control points (which contains the piece) is farther away than
+    the best distance found so far. Surviving pieces are finished with Newton's method.
+
+    Parameters:
+        curve (BezierCurve): the curve to query
+        point (array like): a point with curve.dimension coordinates
+        tol (float): stopping tolerance of the Newton refinement in the parameter
+        max_depth (int): maximum number of halvings of a piece
+
+    Returns:
+        (t, distance): parameter of the closest point and its distance to point
+    """
+    point = np.asarray(point, dtype=np.float64).reshape(-1)
+    points = curve.control_points.astype(np.float64)
+    if point.shape[0] != points.shape[0]:
+        raise ValueError(f"point has {point.shape[0]} coordinates, curve has dimension {points.shape[0]}")
+
+    # pieces this small are close enough to a line for Newton's method to converge
+    small = 1e-3 * max(np.ptp(points, axis=1).max(), np.finfo(np.float64).tiny)
+
+    hodographs = _hodographs(points)
+    best_t = 0.0
+    best = np.linalg.norm(points[:, 0] - point)
+    end = np.linalg.norm(points[:, -1] - point)
+    if end < best:
+        best_t, best = 1.0, end
+
+    # the counter breaks ties so that coefficient arrays are never compared
+    heap = [(0.0, 0, 0.0, 1.0, 0, points)]
+    counter = 1
+    while heap:
+        bound, _, t0, t1, depth, piece = heapq.heappop(heap)
+        if bound >= best:
+            break
+        lo, hi = piece.min(axis=1), piece.max(axis=1)
+        if depth >= max_depth or np.max(hi - lo) <= small:
+            # project onto the chord for a starting guess
+            chord = piece[:, -1] - piece[:, 0]
+            length = chord @ chord
+            s = 0.5 if length == 0 else min(max((point - piece[:, 0]) @ chord / length, 0.0), 1.0)
+            t = _refine_nearest(hodographs, point, t0 + s * (t1 - t0), t0, t1, tol)
+            distance = np.linalg.norm(_evaluate(hodographs, t)[0] - point)
+            if distance < best:
+                best_t, best = t, distance
+            continue
+
+        tm = 0.5 * (t0 + t1)
+        for half, a, b in zip(_halves(piece), (t0, tm), (tm, t1)):
+            distance = np.linalg.norm(half[:, -1] - point)
+            if distance < best:
+                best_t, best = b, distance
+            bound = _box_distance(half.min(axis=1), half.max(axis=1), point)
+            if bound < best:
+                heapq.heappush(heap, (bound, counter, a, b, depth + 1, half))
+                counter += 1
+
+    best_t = _refine_nearest(hodographs, point, best_t, 0.0, 1.0, tol)
+    return best_t, float(np.linalg.norm(_evaluate(hodographs, best_t)[0] - point))
+
+
+def _refine_intersection(hodographs1, hodographs2, t1, t2, iterations=20):
+    """
+    Gauss-Newton iteration on C1(t1) - C2(t2) = 0 with both parameters kept in [0, 1]
+    """
+    for _ in range(iterations):
+        value1, d1, _ = _evaluate(hodographs1, t1)
+        value2, d2, _ = _evaluate(hodographs2, t2)
+        residual = value1 - value2
+        jacobian = np.stack([d1, -d2], axis=1)
+        step = np.linalg.lstsq(jacobian, residual, rcond=None)[0]
+        new1 = min(max(t1 - step[0], 0.0), 1.0)
+        new2 = min(max(t2 - step[1], 0.0), 1.0)
+        moved = max(abs(new1 - t1), abs(new2 - t2))
+        t1, t2 = new1, new2
+        if moved < 1e-15:
+            break
+    residual = _evaluate(hodographs1, t1)[0] - _evaluate(hodographs2, t2)[0]
+    return t1, t2, np.linalg.norm(residual)
+
+
+def _on_curve(curve, points, point, tol):
+    """
+    Parameter of point on curve if it lies within tol of it, else None. The control point
+    box is checked first so that points far from the curve cost no search.
+    """
+    if np.any(point < points.min(axis=1) - tol) or np.any(point > points.max(axis=1) + tol):
+        return None
+    t, distance = nearest_point(curve, point)
+    return float(t) if distance <= tol else None
+
+
+def _overlaps(curve1, points1, curve2, points2, tol, samples=7):
+    """
+    Parameter ranges over which two curves coincide.
+
+    Two polynomial curves that coincide on a range coincide as algebraic curves, so the
+    range only ends where one of the curves ends: its ends are among the four curve end
+    points that lie on the other curve. Consecutive candidates are joined into an overlap
+    when samples of curve1 in between also lie on curve2, within the parameter range.
+
+    Returns:
+        (candidates, overlaps): the end points lying on the other curve as (t1, t2) pairs,
+        and the overlaps as ((t1 start, t1 end), (t2 start, t2 end)) sorted by t1
+    """
+    candidates = []
+    for t1 in (0.0, 1.0):
+        t2 = _on_curve(curve2, points2, points1[:, -1 if t1 else 0], tol)
+        if t2 is not None:
+            candidates.append((t1, t2))
+    for t2 in (0.0, 1.0):
+        t1 = _on_curve(curve1, points1, points2[:, -1 if t2 else 0], tol)
+        if t1 is not None:
+            candidates.append((t1, t2))
+    # an end point of both curves is found twice
+    candidates = [pair for k, pair in enumerate(sorted(candidates))
+                  if not any(abs(pair[0] - s1) <= 1e-7 and abs(pair[1] - s2) <= 1e-7 for s1, s2 in sorted(candidates)[:k])]
+
+    overlaps = []
+    for (a1, a2), (b1, b2) in zip(candidates, candidates[1:]):
+        if b1 - a1 <= 1e-7:
+            continue
+        lo, hi = min(a2, b2) - 1e-7, max(a2, b2) + 1e-7
+        for t1 in a1 + (b1 - a1) * np.arange(1, samples + 1) / (samples + 1):
+            t2 = _on_curve(curve2, points2, curve1.evaluate(t1)[:, 0].astype(np.float64), tol)
+            if t2 is None or not lo <= t2 <= hi:
+                break
+        else:
+            if overlaps and abs(overlaps[-1][0][1] - a1) <= 1e-7:
+                # adjacent ranges, e.g. both curves ending inside the same stretch
+                (s1, _), (s2, _) = overlaps.pop()
+                overlaps.append(((s1, b1), (s2, b2)))
+            else:
+                overlaps.append(((a1, b1), (a2, b2)))
+    return candidates, overlaps
+
+
+def intersect(curve1, curve2, tol=1e-9, max_depth=40, return_overlaps=False):
+    """
+    Finds the intersections of two Bezier curves.
+
+    Pairs of pieces are halved while the bounding boxes of their control points overlap;
+    pairs whose boxes are disjoint cannot intersect and are dropped. Small overlapping
+    pairs give starting guesses that are refined with Newton's method.
+
+    Curves that coincide over a range (collinear segments, a curve and a piece of it)
+    have infinitely many common points. Once there are more hits than two curves without
+    a common piece can have, the overlaps are looked up (see _overlaps) and the search is
+    redone: only their end points are reported as intersections and the pieces inside
+    them are not subdivided.
+
+    Parameters:
+        curve1 (BezierCurve): the first curve
+        curve2 (BezierCurve): the second curve
+        tol (float): distance below which two points are considered equal
+        max_depth (int): maximum number of halvings of a piece
+        return_overlaps (bool): also return the overlapping ranges
+
+    Returns:
+        list of (t1, t2) parameter pairs sorted by t1, one per intersection, and if
+        return_overlaps is True the list of ((t1 start, t1 end), (t2 start, t2 end)) ranges
+        over which the curves coincide
+    """
+    points1 = curve1.control_points.astype(np.float64)
+    points2 = curve2.control_points.astype(np.float64)
+    if points1.shape[0] != points2.shape[0]:
+        raise ValueError(f"dimensions do not match. Curve 1: {points1.shape[0]} , Curve 2: {points2.shape[0]}")
+
+    scale = max(np.ptp(points1, axis=1).max(), np.ptp(points2, axis=1).max(), tol)
+    small = max(1e-3 * scale, tol)
+
+    hodographs1, hodographs2 = _hodographs(points1), _hodographs(points2)
+    # curves without a common piece meet in at most degree1 * degree2 points (Bezout),
+    # more hits than that mean an overlap, which is only looked for then
+    found = _intersect_pieces(points1, points2, hodographs1, hodographs2, [], [], tol, small, max_depth,
+                              limit=max(curve1.degree, 1) * max(curve2.degree, 1))
+    overlaps = []
+    if found is None:
+        candidates, overlaps = _overlaps(curve1, points1, curve2, points2, tol)
+        ranges = [((min(r1), max(r1)), (min(r2), max(r2))) for r1, r2 in overlaps]
+        ends = [(t1, t2) for t1, t2 in candidates if any(lo <= t1 <= hi for (lo, hi), _ in ranges)]
+        found = _intersect_pieces(points1, points2, hodographs1, hodographs2, ranges, ends, tol, small, max_depth)
+
+    if return_overlaps:
+        return sorted(found), overlaps
+    return sorted(found)
+
+
+def _intersect_pieces(points1, points2, hodographs1, hodographs2, ranges, found, tol, small, max_depth, limit=None):
+    """
+    Subdivision search of intersect, skipping pairs of pieces inside the overlap ranges.
+    Returns the list of (t1, t2) hits extending found, or None once there are more than limit.
+    """
+    def inside(t1, t2, margin=1e-7):
+        return any(lo1 + margin < t1 < hi1 - margin and lo2 - margin <= t2 <= hi2 + margin
+                   for (lo1, hi1), (lo2, hi2) in ranges)
+
+    found = list(found)
+    stack = [(points1, 0.0, 1.0, points2, 0.0, 1.0, 0)]
+    while stack:
+        a, a0, a1, b, b0, b1, depth = stack.pop()
+        alo, ahi = a.min(axis=1), a.max(axis=1)
+        blo, bhi = b.min(axis=1), b.max(axis=1)
+        if np.any(alo > bhi + tol) or np.any(blo > ahi + tol):
+            continue
+        if any(lo1 <= a0 and a1 <= hi1 and lo2 <= b0 and b1 <= hi2 for (lo1, hi1), (lo2, hi2) in ranges):
+            # both pieces lie in the same overlap, every point of it is a common point
+            continue
+
+        if depth >= max_depth or max(np.max(ahi - alo), np.max(bhi - blo)) <= small:
+            t1, t2, distance = _refine_intersection(hodographs1, hodographs2, 0.5 * (a0 + a1), 0.5 * (b0 + b1))
+            if distance <= tol and not inside(t1, t2) and \
+                    not any(abs(t1 - s1) <= 1e-7 and abs(t2 - s2) <= 1e-7 for s1, s2 in found):
+                found.append((float(t1), float(t2)))
+                if limit is not None and len(found) > limit:
+                    return None
+            continue
+
+        # split the larger piece, or both while they are of similar size
+        split_a = np.max(ahi - alo) >= 0.5 * np.max(bhi - blo)
+        split_b = np.max(bhi - blo) >= 0.5 * np.max(ahi - alo)
+        am, bm = 0.5 * (a0 + a1), 0.5 * (b0 + b1)
+        parts_a = zip(_halves(a), (a0, am), (am, a1)) if split_a else [(a, a0, a1)]
+        parts_b = list(zip(_halves(b), (b0, bm), (bm, b1))) if split_b else [(b, b0, b1)]
+        for pa, pa0, pa1 in parts_a:
+            for pb, pb0, pb1 in parts_b:
+                stack.append((pa, pa0, pa1, pb, pb0, pb1, depth + 1))
+    return found
+
+
+class CurveBVH:
+    def __init__(self, curves, leaf_size=4):
+        """
+        Builds a bounding volume hierarchy over many Bezier curves of the same dimension.
+        Every curve is bounded by the box of its control points; nodes are split at the
+        median of their widest axis. The tree is stored in flat arrays.
+
+        Parameters:
+            curves (list): BezierCurve objects of equal dimension
+            leaf_size (int): maximum number of curves per leaf
+        """
+        self.curves = list(curves)
+        if not self.curves:
+            raise ValueError("cannot build a hierarchy over an empty sequence of curves")
+        dimension = self.curves[0].dimension
+        if any(curve.dimension != dimension for curve in self.curves):
+            raise ValueError(f"all curves must have dimension {dimension}")
+
+        n = len(self.curves)
+        self.boxes_lo = np.empty((n, dimension))
+        self.boxes_hi = np.empty((n, dimension))
+        for k, curve in enumerate(self.curves):
+            points = curve.control_points.astype(np.float64)
+            self.boxes_lo[k] = points.min(axis=1)
+            self.boxes_hi[k] = points.max(axis=1)
+
+        # nodes are appended as they are created; leaves have left == -1
+        self.order = np.arange(n)
+        lo, hi, left, right, start, count = [], [], [], [], [], []
+        stack = [(0, n, -1, False)]
+        while stack:
+            first, last, parent, is_right = stack.pop()
+            node = len(lo)
+            if parent >= 0:
+                (right if is_right else left)[parent] = node
+            members = self.order[first:last]
+            lo.append(self.boxes_lo[members].min(axis=0))
+            hi.append(self.boxes_hi[members].max(axis=0))
+            left.append(-1)
+            right.append(-1)
+            start.append(first)
+            count.append(last - first)
+            if last - first <= leaf_size:
+                continue
+            centers = self.boxes_lo[members] + self.boxes_hi[members]
+            axis = np.argmax(hi[node] - lo[node])
+            middle = (last - first) // 2
+            self.order[first:last] = members[np.argpartition(centers[:, axis], middle)]
+            stack.append((first + middle, last, node, True))
+            stack.append((first, first + middle, node, False))
+
+        self.node_lo = np.array(lo)
+        self.node_hi = np.array(hi)
+        self.node_left = np.array(left)
+        self.node_right = np.array(right)
+        self.node_start = np.array(start)
+        self.node_count = np.array(count)
+
+    def __len__(self):
+        return len(self.curves)
+
+    def query_box(self, lo, hi):
+        """
+        Returns the indices of the curves whose bounding boxes overlap the box [lo, hi]
+        """
+        lo = np.asarray(lo, dtype=np.float64)
+        hi = np.asarray(hi, dtype=np.float64)
+        out = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if np.any(self.node_lo[node] > hi) or np.any(lo > self.node_hi[node]):
+                continue
+            if self.node_left[node] < 0:
+                members = self.order[self.node_start[node]:self.node_start[node] + self.node_count[node]]
+                overlap = np.all(self.boxes_lo[members] <= hi, axis=1) & np.all(lo <= self.boxes_hi[members], axis=1)
+                out.extend(members[overlap].tolist())
+            else:
+                stack.append(self.node_right[node])
+                stack.append(self.node_left[node])
+        return sorted(out)
+
+    def nearest(self, point, tol=1e-9):
+        """
+        Finds the curve point closest to a given point over all curves of the hierarchy.
+        Nodes and curves are visited nearest box first and skipped once their box is
+        farther than the best distance found.
+
+        Returns:
+            (index, t, distance): the curve index, parameter and distance of the closest point
+        """
+        point = np.asarray(point, dtype=np.float64).reshape(-1)
+        best = (-1, 0.0, np.inf)
+        heap = [(0.0, 0)]
+        while heap:
+            bound, node = heapq.heappop(heap)
+            if bound > best[2]:
+                break
+            if self.node_left[node] < 0:
+                for k in self.order[self.node_start[node]:self.node_start[node] + self.node_count[node]]:
+                    if _box_distance(self.boxes_lo[k], self.boxes_hi[k], point) > best[2]:
+                        continue
+                    t, distance = nearest_point(self.curves[k], point, tol=tol)
+                    if distance < best[2]:
+                        best = (int(k), t, distance)
+            else:
+                for child in (self.node_left[node], self.node_right[node]):
+                    heapq.heappush(heap, (_box_distance(self.node_lo[child], self.node_hi[child], point), child))
+        return best
+
+    def intersect(self, curve, tol=1e-9):
+        """
+        Intersects a curve with every curve of the hierarchy whose box overlaps its own
+
+        Returns:
+            list of (index, t, t_other): curve index, parameter on the query curve and parameter on curve index
+        """
+        points = curve.control_points.astype(np.float64)
+        out = []
+        for k in self.query_box(points.min(axis=1) - tol, points.max(axis=1) + tol):
+            out.extend((k, t, s) for t, s in intersect(curve, self.curves[k], tol=tol))
+        return out
@@ -1,48 +1,105 @@
+from fractions import Fraction
+from functools import lru_cache
+from math import comb as binomial, factorial
+from bbpi._lazy import has_sympy
 from bbpi.bb1curve import BezierCurve
-from sympy import binomial
+from bbpi.bb1calculus import hodograph, integral
+from bbpi.bbprofile import instrumented
 import numpy as np
 
 
-def add(curve1, curve2):
+@lru_cache(maxsize=128)
+def product_weights(d1, d2):
+    """
+    Weight table of the BB-form product of polynomials of degree d1 and d2.
+    Tables are cached per (d1, d2) pair and evicted least recently used first.
+
+    Parameters:
+    d1 -- degree of polynomial 1
+    d2 -- degree of polynomial 2
+
+    Returns:
+    read-only array W of shape ((d1 + 1) * (d2 + 1), d1 + d2 + 1) with
+    W[i1 * (d2 + 1) + i2, i1 + i2] = C(d1,i1) C(d2,i2) / C(d1+d2,i1+i2) and zeros elsewhere
+    """
+    weights = np.zeros((d1 + 1, d2 + 1, d1 + d2 + 1))
+    for i1 in range(d1 + 1):
+        for i2 in range(d2 + 1):
+            weights[i1, i2, i1 + i2] = binomial(d1, i1) * binomial(d2, i2) / binomial(d1 + d2, i1 + i2)
+    weights = weights.reshape((d1 + 1) * (d2 + 1), d1 + d2 + 1)
+    weights.setflags(write=False)
+    return weights
+
+
+@lru_cache(maxsize=128)
+def binomial_row(n):
+    """
+    Integer binomial coefficients C(n, 0), ..., C(n, n) as a read-only object array of Python ints
+    """
+    row = np.array([binomial(n, i) for i in range(n + 1)], dtype=object)
+    row.setflags(write=False)
+    return row
+
+def _to_fraction(x):
+    if isinstance(x, (int, np.integer)):
+        return Fraction(int(x))
+    if isinstance(x, (Fraction, float, np.floating)):
+        return Fraction(x)
+    if getattr(x, 'is_Rational', False):
+        # sympy Rational and Integer
+        return Fraction(int(x.p), int(x.q))
+    raise TypeError(f"exact arithmetic needs rational control points, found {x!r} of type {type(x)}")
+
+def exact_points(points):
+    """
+    Converts control points to an object array of Fractions, the input of the exact backend.
+    Floats are converted exactly, to the rational value of their binary representation.
+    """
+    points = np.asarray(points)
+    out = np.empty(points.shape, dtype=object)
+    out.ravel()[:] = [_to_fraction(x) for x in points.ravel()]
+    return out
+
+
+
+def _curve_sizes(curve, *args, **kwargs):
+    return {'degree': curve.degree, 'dimension': curve.dimension}
+
+def _pair_sizes(curve1, curve2, *args, **kwargs):
+    return {'degree': max(curve1.degree, curve2.degree), 'dimension': curve1.dimension}
+
+
+@instrumented('add', _pair_sizes)
+def add(curve1, curve2, exact=False):
         """
-        Adds the coefficients of two univariate bezier curves
+        Adds the coefficients of two univariate bezier curves. A curve of lower degree is
+        first elevated to the degree of the other one, see elevate.
         
         Parameters:
-        degree (integer): the degree of the new curve.
         curve1 (BezierCurve): The first Bezier curve.
         curve2 (BezierCurve): The second Bezier curve.
+        exact (bool): compute with Fractions, see exact_points
 
         Returns:
         out: A new Bezier curve resulting from the addition of the control points of the two curves.
         """
         if curve1.control_points.shape[0] != curve2.control_points.shape[0]:
-            raise ValueError(f"dimensions do not match. Curve 1: {curve1.control_points.shape[0]} , Curve 2: {curve1.control_points.shape[0]}")
-        
-
-        if(curve1.degree == curve2.degree):
-                # Initialize an empty matrix with the same number of rows as control_points and columns as degree + 1
-            out = [[0 for _ in range(curve1.degree + 1)] for _ in range(curve1.control_points.shape[0])]
-
-            for dimension, row in enumerate(out):
-                
-                for i, (element1, element2) in enumerate(zip(curve1.control_points[dimension],curve2.control_points[dimension])):
-                    out[dimension][i] += element1 + element2
-                    # for j, coefficient in enumerate(curve1.control_points[dimension]):
-                    #     print(f"coefficient[{j}]: {coefficient}")
-                    #     out[dimension][i] += coefficient
-
-                    # for k, coefficient in enumerate(curve2.control_points[dimension]):
-                    #     print(f"coefficient[{k}]: {coefficient}")
-                    #     out[dimension][i] += coefficient
+            raise ValueError(f"dimensions do not match. Curve 1: {curve1.control_points.shape[0]} , Curve 2: {curve2.control_points.shape[0]}")
 
+        points1, points2 = curve1.control_points, curve2.control_points
+        if exact:
+            points1, points2 = exact_points(points1), exact_points(points2)
+        if curve1.degree < curve2.degree:
+            points1 = _elevate_points(points1, curve2.degree - curve1.degree)
+        elif curve2.degree < curve1.degree:
+            points2 = _elevate_points(points2, curve1.degree - curve2.degree)
 
-            print(out)
-                # Convert the output list of lists into a numpy array for the new curve
-            return BezierCurve(np.array(out))
-        else:
-            raise ValueError(f"degrees of the two curves do not match, found {curve1.degree} and {curve2.degree}")
+        if exact:
+            return BezierCurve(points1 + points2)
+        return BezierCurve(points1 + points2, numeric=curve1.numeric and curve2.numeric)
         
-def multiply(curve1,curve2,lo=None, hi=None):
+@instrumented('multiply', _pair_sizes)
+def multiply(curve1,curve2,lo=None, hi=None, exact=False):
     """
     Multiply two univariate polynomials in BB-form
 
@@ -53,96 +110,378 @@ def multiply(curve1,curve2,lo=None, hi=None):
     d2 -- degree of polynomial 2
     lo -- (optional) lower index of vectors for component-wise multiplication
     hi -- (optional) upper index of vectors for component-wise multiplication
+    exact -- (optional) compute with Fractions and integer binomials, see exact_points; not with lo/hi
 
     Returns:
     out -- array of coefficients of the product polynomial in BB-form
     """
     if curve1.control_points.shape[0] != curve2.control_points.shape[0]:
         raise ValueError(f"Found different dimensions: curve 1: {curve1.control_points.shape[0]} curve 2: {curve2.control_points.shape[0]}")
+
+    if exact and not (lo is None or hi is None):
+        raise ValueError("exact multiplication does not support component-wise lo/hi products")
+    if exact:
+        # integer weighted convolution, divided once per output coefficient
+        d1, d2 = curve1.degree, curve2.degree
+        a = exact_points(curve1.control_points) * binomial_row(d1)
+        b = exact_points(curve2.control_points) * binomial_row(d2)
+        out = np.zeros((a.shape[0], d1 + d2 + 1), dtype=object)
+        for i1 in range(d1 + 1):
+            out[:, i1:i1 + d2 + 1] += a[:, i1:i1 + 1] * b
+        return BezierCurve(out / binomial_row(d1 + d2))
+
+    numeric = curve1.control_points.dtype != object and curve2.control_points.dtype != object
+    if numeric and (lo is None or hi is None):
+        # scaled convolution of all dimensions at once against the cached weight table
+        a = curve1.control_points.astype(np.float64)
+        b = curve2.control_points.astype(np.float64)
+        outer = (a[:, :, None] * b[:, None, :]).reshape(a.shape[0], -1)
+        return BezierCurve(outer @ product_weights(curve1.degree, curve2.degree), numeric=curve1.numeric and curve2.numeric)
     
     dgout = curve1.degree + curve2.degree
+    # keep SymPy coefficients free of Fractions
+    if has_sympy(curve1.control_points) or has_sympy(curve2.control_points):
+        from sympy import Rational as ratio
+    else:
+        ratio = Fraction
     out = [[0 for _ in range(dgout + 1)] for _ in range(curve1.control_points.shape[0])]
     for dimension, row in enumerate(out): 
         if lo is None or hi is None:
             for i1 in range(curve1.degree + 1):
                 for i2 in range(curve2.degree + 1):
-                    mult = binomial(curve1.degree, i1) * binomial(curve2.degree, i2) / binomial(curve1.degree+curve2.degree, i1 + i2)
+                    mult = ratio(binomial(curve1.degree, i1) * binomial(curve2.degree, i2), binomial(curve1.degree+curve2.degree, i1 + i2))
                     out[dimension][i1 + i2] += mult * curve1.control_points[dimension][i1] * curve2.control_points[dimension][i2]
         else:
             for i1 in range(curve1.degree + 1):
                 for i2 in range(curve2.degree + 1):
-                    mult = binomial(curve1.degree, i1) * binomial(curve2.degree, i2) / binomial(curve1.degree+curve2.degree, i1 + i2)
+                    mult = ratio(binomial(curve1.degree, i1) * binomial(curve2.degree, i2), binomial(curve1.degree+curve2.degree, i1 + i2))
                     h = sum(curve1.b[m][i1] + curve2.b[m][i2] for m in range(lo, hi + 1))
                     out[dimension][i1 + i2] += mult * h
 
     return BezierCurve(np.array(out))
 
-def degree_raise(curve):
+@lru_cache(maxsize=128)
+def elevation_matrix(degree, r, exact=False):
     """
-    raise the degree of a bezier curve by 1
+    Matrix E elevating BB-form coefficients from degree to degree + r in one product,
+    elevated = points @ E. Matrices are cached per (degree, r, exact).
+
+    Parameters:
+    degree -- degree of the input coefficients
+    r -- number of degrees to elevate by
+    exact -- Fraction entries in an object array instead of float64
+
+    Returns:
+    read-only array E of shape (degree + 1, degree + r + 1) with
+    E[i, i + k] = C(degree,i) C(r,k) / C(degree+r,i+k) and zeros elsewhere
+    """
+    matrix = np.zeros((degree + 1, degree + r + 1), dtype=object)
+    for i in range(degree + 1):
+        for k in range(r + 1):
+            matrix[i, i + k] = Fraction(binomial(degree, i) * binomial(r, k), binomial(degree + r, i + k))
+    if not exact:
+        matrix = matrix.astype(np.float64)
+    matrix.setflags(write=False)
+    return matrix
+
+def _elevate_points(points, r):
+    """
+    Elevates a (dimension, degree + 1) coefficient array by r degrees; object arrays
+    (symbols, Fractions) go through the exact matrix and stay exact
+    """
+    if r == 0:
+        return points.copy()
+    if points.dtype == object:
+        return points @ elevation_matrix(points.shape[1] - 1, r, exact=True)
+    return points.astype(np.float64) @ elevation_matrix(points.shape[1] - 1, r)
+
+def _legendre_rows(n, m):
+    """
+    Integer matrix S with S[j, k] (n + m + 1)! / C(n, j) the k-th shifted Legendre
+    coefficient, k <= m, of the Bernstein polynomial b_j of degree n
+    """
+    factorials = [factorial(x) for x in range(2 * n + 2)]
+    top = factorial(n + m + 1)
+    rows = np.empty((n + 1, m + 1), dtype=object)
+    for k in range(m + 1):
+        # (2k + 1) int b_j P_k dt, with P_k = sum_l (-1)^(k+l) C(k, l) b_l of degree k
+        weight = (2 * k + 1) * (top // factorials[n + k + 1])
+        signs = [(-1) ** (k + l) * binomial(k, l) ** 2 for l in range(k + 1)]
+        for j in range(n + 1):
+            rows[j, k] = weight * sum(c * factorials[l + j] * factorials[n + k - l - j] for l, c in enumerate(signs))
+    return rows
+
+@lru_cache(maxsize=32)
+def _legendre_bernstein(m):
+    """
+    Integer matrix T with T[k, i] / C(m, i) the i-th Bernstein coefficient of degree m of
+    the shifted Legendre polynomial P_k
+    """
+    table = np.empty((m + 1, m + 1), dtype=object)
+    for k in range(m + 1):
+        for i in range(m + 1):
+            table[k, i] = sum((-1) ** (k + l) * binomial(k, l) ** 2 * binomial(m - k, i - l)
+                              for l in range(max(0, i - m + k), min(k, i) + 1))
+    return table
+
+@lru_cache(maxsize=128)
+def reduction_matrix(degree, r):
+    """
+    Matrix R of the least-squares degree reduction from degree to degree - r,
+    reduced = points @ R. Matrices are cached per (degree, r).
+
+    The best approximation of degree m = degree - r keeps the first m + 1 shifted
+    Legendre coefficients, so R converts Bernstein to Legendre coefficients, truncates
+    and converts back. The Bernstein Gram matrices are too badly conditioned to solve in
+    floating point (about 1e11 at degree 20); both conversions have closed-form integer
+    entries, so R is computed exactly and each entry rounded once. A miss costs
+    O(degree * m^2) big integer products, about 10 ms at degree 30 and 0.3 s at degree 80.
+
+    Returns:
+    read-only array R of shape (degree + 1, degree - r + 1)
+    """
+    m = degree - r
+    numerators = _legendre_rows(degree, m).dot(_legendre_bernstein(m))
+    top = factorial(degree + m + 1)
+    # int / int rounds correctly however large the operands are
+    matrix = np.array([[binomial(degree, j) * numerators[j, i] / (binomial(m, i) * top) for i in range(m + 1)]
+                       for j in range(degree + 1)], dtype=np.float64)
+    matrix.setflags(write=False)
+    return matrix
+
+def elevate(curve, r=1, exact=False):
+    """
+    Elevates the degree of a bezier curve by r in a single matrix product, see elevation_matrix
+
+    Parameters:
+    curve -- the curve to elevate
+    r -- number of degrees to elevate by
+    exact -- (optional) compute with Fractions, see exact_points
+
+    Returns:
+    out -- bezier curve with degree + r, the same polynomial as curve
+    """
+    if r < 0:
+        raise ValueError(f"cannot elevate by {r} degrees, use reduce_degree to lower the degree")
+    if exact:
+        return BezierCurve(_elevate_points(exact_points(curve.control_points), r))
+    return BezierCurve(_elevate_points(curve.control_points, r), numeric=curve.numeric)
+
+def reduce_degree(curve, r=1):
+    """
+    Lowers the degree of a bezier curve by r, choosing the curve of degree - r closest to
+    it in the least-squares sense over [0, 1]. A curve that is an elevated curve of the
+    lower degree is recovered exactly, up to rounding.
+
+    Parameters:
+    curve -- the curve to reduce
+    r -- number of degrees to reduce by
+
+    Returns:
+    out -- bezier curve with degree - r
+    """
+    if not 0 <= r <= curve.degree:
+        raise ValueError(f"cannot reduce a curve of degree {curve.degree} by {r} degrees")
+    return BezierCurve(curve.control_points.astype(np.float64) @ reduction_matrix(curve.degree, r), numeric=curve.numeric)
+
+@instrumented('degree_raise', _curve_sizes)
+def degree_raise(curve, exact=False):
+    """
+    raise the degree of a bezier curve by 1, see elevate
 
     Parameters:
     curve -- array of coefficients 
+    exact -- (optional) compute with Fractions, see exact_points
 
     Returns:
     out -- bezier curve with degree + 1
     """
-    d1 = curve.degree + 1
+    return elevate(curve, 1, exact)
+    
+@instrumented('subdivide', _curve_sizes)
+def subdivide(curve, s=0.5, exact=False):
+    """
+    Subdivide the Bezier curve at a parameter s, returning two new Bezier curves.
 
-    out = [[0 for _ in range(d1 + 1)] for _ in range(curve.control_points.shape[0])]
+    :param s: The parameter at which to subdivide the curve, typically in [0, 1].
+    :param exact: Run de Casteljau on Fractions, with s converted exactly, see exact_points.
+    :return: A tuple containing two new BezierCurve instances representing the subdivided curves.
+    """
+    if exact:
+        work = exact_points(curve.control_points)
+        left = np.empty_like(work)
+        right = np.empty_like(work)
+        _split(work, _to_fraction(s), left, right)
+        return BezierCurve(left), BezierCurve(right)
 
-    for dimension, row in enumerate(out):
-        for i in range(d1+1):
-            if 0 < i:
-                out[dimension][i] += i * curve.control_points[dimension][i-1] /d1
-            if i <= curve.degree:
-                out[dimension][i] += (d1 - i) * curve.control_points[dimension][i] /d1
-            
-    return BezierCurve(np.array(out))
-    
-def subdivide(curve, s=0.5):
-        """
-        Subdivide the Bezier curve at a parameter s, returning two new Bezier curves.
-        
-        :param s: The parameter at which to subdivide the curve, typically in [0, 1].
-        :return: A tuple containing two new BezierCurve instances representing the subdivided curves.
-        """
-        dg = curve.degree
-        b_local = np.copy(curve.control_points)
-        bl = [[0 for _ in range(dg + 1)] for _ in range(curve.control_points.shape[0])]
-        br = [[0 for _ in range(dg + 1)] for _ in range(curve.control_points.shape[0])]
-        for dimension, row in enumerate(curve.control_points):
-            
-
-            bl[dimension][0] = b_local[dimension][0]
-            br[dimension][dg] = b_local[dimension][dg]
-            for l in range(1, dg+1):
-                for i in range(dg+1-l):
-                    b_local[dimension][i] = (1-s) * b_local[dimension][i] + s * b_local[dimension][i+1]
-                bl[dimension][l] = b_local[dimension][0]
-                br[dimension][dg-l] = b_local[dimension][dg-l]
-
-            return BezierCurve(bl), BezierCurve(br)
-        
-def integral(curve):
-    x = 1
+    work = _working_copy(curve.control_points)
+    left = np.empty_like(work)
+    right = np.empty_like(work)
+    _split(work, s, left, right)
+    return BezierCurve(left, numeric=curve.numeric), BezierCurve(right, numeric=curve.numeric)
 
-def derivative(curve):
+@instrumented('split_at', _curve_sizes)
+def split_at(curve, ts):
     """
-    Compute the derivative of a Bezier curve and replaces the control points 
-    , which is a Bezier curve of degree n-1
+    Splits a Bezier curve at several parameters in one pass
+
+    Every piece [t_k, t_k+1] is cut out of the original curve independently, so the
+    pieces do not accumulate the error of repeated splits of the remainder.
+
+    Parameters:
+    curve (BezierCurve): the curve to split
+    ts (array like): non-decreasing split parameters in [0, 1]
 
     Returns:
-        BezierCurve: A new Bezier curve representing the derivative.
+    list of len(ts) + 1 BezierCurve pieces, in curve order
     """
-    n = curve.degree
-    
-    derived_control_points = np.array([[n * (curve.control_points[dim][i + 1] - curve.control_points[dim][i]) for i in range(n)] for dim in range(curve.control_points.shape[0])])
-    curve.control_points = derived_control_points
-    
+    pieces = _pieces(_working_copy(curve.control_points), ts)
+    return [BezierCurve(piece, numeric=curve.numeric) for piece in pieces]
+
+def _working_copy(points):
+    """
+    Copy of control points de Casteljau can run on in place: object arrays keep their
+    entries (symbols, fractions), anything else becomes float64
+    """
+    if points.dtype == object:
+        return points.copy()
+    return points.astype(np.float64)
+
+def _split(work, s, left, right):
+    """
+    De Casteljau split of (..., dimension, degree + 1) coefficient arrays at s, for all
+    dimensions (and leading batch axes) at once. s is a scalar or broadcasts against the
+    leading axes, e.g. shape (n, 1, 1) for one parameter per curve of a batch. The halves
+    are written into the preallocated left and right arrays; work holds the input
+    coefficients and is overwritten.
+    """
+    dg = work.shape[-1] - 1
+    left[..., 0] = work[..., 0]
+    right[..., dg] = work[..., dg]
+    for l in range(1, dg + 1):
+        work[..., :dg + 1 - l] = (1 - s) * work[..., :dg + 1 - l] + s * work[..., 1:dg + 2 - l]
+        left[..., l] = work[..., 0]
+        right[..., dg - l] = work[..., dg - l]
+
+def _pieces(points, ts):
+    """
+    Cuts (..., dimension, degree + 1) coefficient arrays at the parameters ts, shared as
+    shape (m,) or per leading index as shape points.shape[:-2] + (m,).
+    Piece k is the left half of a split at its end, split again at start / end.
+
+    Returns:
+    array of shape (m + 1,) + points.shape, the pieces in order
+    """
+    ts = np.asarray(ts, dtype=np.float64)
+    if ts.ndim == 0:
+        ts = ts.reshape(1)
+    ts = np.broadcast_to(ts, points.shape[:-2] + ts.shape[-1:])
+    if np.any(ts < 0) or np.any(ts > 1) or np.any(np.diff(ts, axis=-1) < 0):
+        raise ValueError("split parameters must be non-decreasing and lie in [0, 1]")
+
+    edge = np.ones(ts.shape[:-1] + (1,))
+    # piece axis first, then the leading axes of points, then (dimension, degree + 1)
+    ends = np.moveaxis(np.concatenate([ts, edge], axis=-1), -1, 0)[..., None, None]
+    starts = np.moveaxis(np.concatenate([0 * edge, ts], axis=-1), -1, 0)[..., None, None]
+    ratios = np.divide(starts, ends, out=np.zeros_like(starts), where=ends > 0)
+
+    work = np.broadcast_to(points, (ends.shape[0],) + points.shape).copy()
+    left = np.empty_like(work)
+    right = np.empty_like(work)
+    _split(work, ends, left, right)
+    _split(left, ratios, work, right)
+    return right
+
+def _flat(points, tol):
+    """
+    Control-polygon flatness test: True if every interior control point lies within
+    tol of the chord from the first to the last control point.
+    """
+    start = points[:, :1]
+    chord = points[:, -1:] - start
+    offsets = points[:, 1:-1] - start
+    length = np.dot(chord[:, 0], chord[:, 0])
+    if length > 0:
+        offsets = offsets - chord * np.clip(chord[:, 0] @ offsets / length, 0, 1)
+    return np.all(np.einsum('ij,ij->j', offsets, offsets) <= tol * tol)
+
+@instrumented('flatten', _curve_sizes)
+def flatten(curve, tol=1e-3, max_depth=32, return_params=False):
+    """
+    Approximates a Bezier curve by a polyline with as few segments as the tolerance allows.
+
+    Pieces are split in half with de Casteljau's algorithm (as in subdivide) until their
+    control polygon lies within tol of its chord; the curve is then within tol of the
+    polyline. The work runs on an explicit stack in preallocated buffers.
 
-    return BezierCurve(derived_control_points)
+    Parameters:
+    curve (BezierCurve): the curve to flatten
+    tol (float): maximum distance between the curve and the polyline
+    max_depth (int): maximum number of halvings of a single piece
+    return_params (bool): also return the parameter value of every polyline vertex
+
+    Returns:
+    np.ndarray of shape (dimension, n_points) with the polyline vertices in curve order,
+    and the array of their parameters if return_params is True
+    """
+    if tol <= 0:
+        raise ValueError(f"tolerance must be positive, found {tol}")
+
+    points = curve.control_points.astype(np.float64)
+    # depth first, left half first: at most one pending right half per level
+    stack = np.empty((max_depth + 1,) + points.shape)
+    bounds = np.empty((max_depth + 1, 3))
+    stack[0] = points
+    bounds[0] = (0.0, 1.0, 0)
+    top = 1
+
+    capacity = 64
+    out = np.empty((points.shape[0], capacity))
+    params = np.empty(capacity)
+    out[:, 0] = points[:, 0]
+    params[0] = 0.0
+    count = 1
+
+    piece = np.empty_like(points)
+    work = np.empty_like(points)
+    while top:
+        top -= 1
+        piece[:] = stack[top]
+        t0, t1, depth = bounds[top]
+        while depth < max_depth and not _flat(piece, tol):
+            tm = 0.5 * (t0 + t1)
+            depth += 1
+            work[:] = piece
+            _split(work, 0.5, piece, stack[top])
+            bounds[top] = (tm, t1, depth)
+            top += 1
+            t1 = tm
 
+        if count == capacity:
+            capacity *= 2
+            out = np.concatenate([out, np.empty_like(out)], axis=1)
+            params = np.concatenate([params, np.empty_like(params)])
+        out[:, count] = piece[:, -1]
+        params[count] = t1
+        count += 1
 
+    if return_params:
+        return out[:, :count], params[:count]
+    return out[:, :count]
+        
+@instrumented('derivative', _curve_sizes)
+def derivative(curve, exact=False):
+    """
+    Compute the derivative of a Bezier curve, which is a Bezier curve of degree n-1.
+    The input curve is left unchanged; its hodograph is cached on it, see hodograph.
+
+    Parameters:
+        exact (bool): compute with Fractions, see exact_points
 
+    Returns:
+        BezierCurve: A new Bezier curve representing the derivative.
+    """
+    if exact and curve.degree > 0:
+        return BezierCurve(curve.degree * np.diff(exact_points(curve.control_points), axis=1))
 
+    return BezierCurve(hodograph(curve).copy(), numeric=curve.numeric)
@@ -1,7 +1,93 @@
-from sympy import symbols, factorial
+from functools import lru_cache
+from math import factorial as ifactorial
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+from ._lazy import is_symbolic
+from .bb1curve import iter_chunks
+from .bbcache import surface_basis_cache, SampleCache
+from .bbprofile import instrumented
+
+_BLOCK = 1 << 14
+
+
+@lru_cache(maxsize=32)
+def multinomial_table(dg):
+    """
+    Builds the index and coefficient table of the bivariate Bernstein basis of degree dg
+
+    Parameters:
+        dg (int): degree of the basis
+    Returns:
+        (i, j, k, coefficients): cached read-only integer index arrays with i + j + k = dg and the
+        matching multinomial coefficients dg! / (i! j! k!) as float64
+    """
+    i, j = np.array([(i, j) for i in range(dg + 1) for j in range(dg + 1 - i)]).T.reshape(2, -1)
+    k = dg - i - j
+    coefficients = np.array([ifactorial(dg) // (ifactorial(a) * ifactorial(b) * ifactorial(c)) for a, b, c in zip(i, j, k)], dtype=np.float64)
+    for table in (i, j, k, coefficients):
+        table.setflags(write=False)
+    return i, j, k, coefficients
+
+
+def bernstein_matrix2(dg, u, v):
+    """
+    Builds the numeric bivariate Bernstein basis matrix for a batch of points
+
+    Parameters:
+        dg (int): degree of the basis
+        u (np.ndarray): 1-D array of parameters along the u-direction
+        v (np.ndarray): 1-D array of parameters along the v-direction
+    Returns:
+        np.ndarray of shape (len(u), number of terms) with columns ordered as in multinomial_table(dg)
+    """
+    i, j, k, coefficients = multinomial_table(dg)
+    u = u[:, None]
+    v = v[:, None]
+    powers = np.arange(dg + 1)
+    upow = u ** powers
+    vpow = v ** powers
+    wpow = (1 - u - v) ** powers
+    return coefficients * upow[:, i] * vpow[:, j] * wpow[:, k]
+
+
+@lru_cache(maxsize=32)
+def triangle_grid(n):
+    """
+    Uniform grid of the triangular parameter domain u, v >= 0, u + v <= 1
+
+    Parameters:
+        n (int): number of subdivisions of each edge of the domain
+    Returns:
+        (u, v): cached read-only arrays of the (n + 1)(n + 2) / 2 points (a / n, b / n) with
+        a + b <= n, ordered by a, then b
+    """
+    a, b = np.array([(a, b) for a in range(n + 1) for b in range(n + 1 - a)]).T.reshape(2, -1)
+    u, v = a / n, b / n
+    u.setflags(write=False)
+    v.setflags(write=False)
+    return u, v
+
+
+@lru_cache(maxsize=32)
+def triangle_indices(n):
+    """
+    Triangles of the uniform grid triangle_grid(n), sharing its vertices
+
+    Parameters:
+        n (int): number of subdivisions of each edge of the domain
+    Returns:
+        cached read-only int32 array of shape (n * n, 3), indices into the grid points,
+        every triangle counterclockwise in the (u, v) plane
+    """
+    a, b = np.array([(a, b) for a in range(n) for b in range(n - a)], dtype=np.int64).T.reshape(2, -1)
+    # position of grid point (a, b): the rows before a hold n + 1, n, ... points
+    index = lambda a, b: a * (n + 1) - a * (a - 1) // 2 + b
+    up = np.stack([index(a, b), index(a + 1, b), index(a, b + 1)], axis=1)
+    a, b = a[a + b < n - 1], b[a + b < n - 1]
+    down = np.stack([index(a + 1, b), index(a + 1, b + 1), index(a, b + 1)], axis=1)
+    triangles = np.concatenate([up, down]).astype(np.int32)
+    triangles.setflags(write=False)
+    return triangles
+
 
 class BivariateBezierSurface:
     def __init__(self, control_points, var='b'):
@@ -16,7 +102,31 @@ class BivariateBezierSurface:
             raise TypeError(f"Control points must be a 2D list or a 2D numpy array. Found {type(control_points)}")
         
         self.control_points = np.array(control_points)
-        self.degree = self.control_points.shape[0] - 1  # Assuming square matrix of control points
+
+    @property
+    def control_points(self):
+        """
+        Read-only view of the square coefficient matrix; entry [i, j] weighs the basis
+        function with indices i, j. Edit through modify_control_point or assign a new matrix.
+        """
+        view = self._control_points.view()
+        view.flags.writeable = False
+        return view
+
+    @control_points.setter
+    def control_points(self, points):
+        self._control_points = points
+        self.degree = points.shape[0] - 1  # Assuming square matrix of control points
+        # compiled expressions and samples belong to the old coefficients
+        self._symbolic = {}
+        self._samples = SampleCache()
+
+    def __getstate__(self):
+        # compiled closures do not pickle and the samples are rebuilt on demand
+        return {'control_points': self._control_points}
+
+    def __setstate__(self, state):
+        self.control_points = state['control_points']
 
     def basis(self, i, j, dg, u, v):
         """
@@ -30,44 +140,294 @@ class BivariateBezierSurface:
             v (symbol): The parameter value along the v-direction.
 
         Returns:
-            sympy expression: The Bernstein basis function.
+            sympy expression: The Bernstein basis function, or its value for numeric u and v.
         """
         w = 1 - u - v
         k = dg - i - j
+        if not (is_symbolic(u) or is_symbolic(v)):
+            if k < 0:
+                return 0
+            return ifactorial(dg) // (ifactorial(i) * ifactorial(j) * ifactorial(k)) * (u**i) * (v**j) * (w**k)
+
+        from sympy import factorial
         return factorial(dg) / (factorial(i) * factorial(j) * factorial(k)) * (u**i) * (v**j) * (w**k)
 
-    def evaluate(self, u=symbols('u'), v=symbols('v')):
+    @instrumented('BivariateBezierSurface.evaluate', lambda self, u=None, v=None: {
+        'degree': self.degree, 'samples': max(np.size(u), np.size(v)) if u is not None and v is not None else 0})
+    def evaluate(self, u=None, v=None):
         """
         Evaluates the Bezier surface at parameters (u, v).
 
+        Numeric parameters may be floats or arrays of any (matching) shape and are
+        evaluated all at once; SymPy symbols go through the symbolic basis.
+
+        Parameters:
+            u (float, np.ndarray or symbol): The parameter value along the u-direction. Defaults to the symbol u.
+            v (float, np.ndarray or symbol): The parameter value along the v-direction. Defaults to the symbol v.
+
+        Returns:
+            float or np.ndarray: The point(s) on the Bezier surface corresponding to the parameters (u, v).
+        """
+        if u is None or v is None:
+            from sympy import symbols
+            u = symbols('u') if u is None else u
+            v = symbols('v') if v is None else v
+        if is_symbolic(u) or is_symbolic(v) or self.control_points.dtype == object:
+            return self._evaluate_symbolic(u, v)
+
+        u, v = np.broadcast_arrays(np.asarray(u, dtype=np.float64), np.asarray(v, dtype=np.float64))
+        point = self._evaluate_numeric(u.ravel(), v.ravel()).reshape(u.shape)
+        return point[()] if point.ndim == 0 else point
+
+    def _evaluate_numeric(self, u, v):
+        """
+        Evaluates the surface at flat arrays of barycentric points. Only the indices
+        with i + j <= degree contribute to the triangular basis.
+        """
+        i, j, _, _ = multinomial_table(self.degree)
+        weights = self.control_points[i, j].astype(np.float64)
+        if u.shape[0] <= surface_basis_cache.max_points:
+            return self.basis_matrix(u, v) @ weights
+
+        out = np.empty(u.shape[0], dtype=np.float64)
+        # work in blocks so the (points, terms) matrix stays small for dense grids
+        for start in range(0, u.shape[0], _BLOCK):
+            out[start:start + _BLOCK] = bernstein_matrix2(self.degree, u[start:start + _BLOCK], v[start:start + _BLOCK]) @ weights
+        return out
+
+    def iter_evaluate(self, u_source, v_source, chunk_size=1 << 14, out=None):
+        """
+        Evaluates the surface over large sources of (u, v) points one chunk at a time, so
+        memory stays bounded by chunk_size no matter how many points there are.
+
+        Parameters:
+            u_source (np.ndarray, np.memmap or iterable): parameters along the u-direction
+            v_source (np.ndarray, np.memmap or iterable): parameters along the v-direction, same length
+            chunk_size (int): number of points evaluated per step
+            out (np.ndarray or np.memmap, optional): 1-D array the results are written into
+                directly; its slices are yielded
+        Yields:
+            np.ndarray with one value per point of the chunk
+        """
+        i, j, _, _ = multinomial_table(self.degree)
+        weights = self.control_points[i, j].astype(np.float64)
+        v_chunks = iter_chunks(v_source, chunk_size)
+        for start, u in iter_chunks(u_source, chunk_size):
+            _, v = next(v_chunks, (start, None))
+            if v is None or u.shape != v.shape:
+                raise ValueError("u_source and v_source must have the same length")
+            basis = bernstein_matrix2(self.degree, u, v)
+            if out is None:
+                yield basis @ weights
+            else:
+                target = out[start:start + u.shape[0]]
+                if target.shape[0] != u.shape[0]:
+                    raise ValueError(f"out has {out.shape[0]} entries, the source has more points")
+                np.matmul(basis, weights, out=target)
+                yield target
+        if next(v_chunks, None) is not None:
+            raise ValueError("u_source and v_source must have the same length")
+
+    def sample(self, n=32):
+        """
+        Samples the surface on the uniform triangular grid triangle_grid(n).
+
+        The samples are cached per n. modify_control_point updates every cached buffer in
+        place by adding the change of the coefficient times its basis column, which costs
+        O(samples) per edit instead of a full re-evaluation.
+
+        Parameters:
+            n (int): number of subdivisions of each edge of the domain
+        Returns:
+            read-only np.ndarray with one value per grid point
+        """
+        def build():
+            i, j, _, _ = multinomial_table(self.degree)
+            basis = bernstein_matrix2(self.degree, *triangle_grid(n))
+            return basis, basis @ self.control_points[i, j].astype(np.float64)
+        return self._samples.get(n, build)
+
+    def tessellation_level(self, tol):
+        """
+        Smallest subdivision level n at which the flat triangles of triangle_grid(n) are
+        within tol of the surface. Uses the bound d(d - 1) max|second difference| / (2 n^2)
+        on the error of linear interpolation, from the second differences of the
+        coefficients along the three edge directions of the domain.
+        """
+        if tol <= 0:
+            raise ValueError(f"tolerance must be positive, found {tol}")
+        dg = self.degree
+        if dg < 2:
+            return 1
+        c = self.control_points.astype(np.float64)
+        i, j = np.meshgrid(np.arange(dg - 1), np.arange(dg - 1), indexing='ij')
+        i, j = i[i + j <= dg - 2], j[i + j <= dg - 2]
+        second = np.concatenate([
+            c[i + 2, j] - 2 * c[i + 1, j] + c[i, j],
+            c[i, j + 2] - 2 * c[i, j + 1] + c[i, j],
+            c[i + 2, j] - 2 * c[i + 1, j + 1] + c[i, j + 2],
+        ])
+        bound = dg * (dg - 1) * np.max(np.abs(second)) / 2
+        return max(1, int(np.ceil(np.sqrt(bound / tol))))
+
+    def tessellate(self, level=None, tol=None, max_level=1024):
+        """
+        Indexed triangle mesh of the surface over its triangular domain.
+
+        Every grid point is evaluated once and shared by all the triangles around it. Dense
+        grids are evaluated in blocks and nothing is kept on the surface; use sample(level)
+        for a grid that is re-read after every edit.
+
         Parameters:
-            u (float): The parameter value along the u-direction.
-            v (float): The parameter value along the v-direction.
+            level (int): number of subdivisions of each edge of the domain
+            tol (float): pick the level from this error tolerance instead, see tessellation_level
+            max_level (int): upper limit of the level chosen from tol
+        Returns:
+            (vertices, indices): float64 array of shape ((n + 1)(n + 2) / 2, 3) with rows
+            (u, v, z), and the int32 triangle indices of shape (n * n, 3)
+        """
+        if level is None:
+            if tol is None:
+                raise ValueError("either a level or a tolerance is needed")
+            level = min(self.tessellation_level(tol), max_level)
+        if level < 1:
+            raise ValueError(f"level must be at least 1, found {level}")
+        u, v = triangle_grid(level)
+        return np.column_stack([u, v, self._evaluate_numeric(u, v)]), triangle_indices(level)
 
+    def _update_samples(self, i, j, delta):
+        """
+        Applies the change delta of coefficient (i, j) to the cached sample buffers
+        """
+        table_i, table_j, _, _ = multinomial_table(self.degree)
+        term = np.flatnonzero((table_i == i) & (table_j == j))
+        if term.size == 0:
+            # coefficients with i + j > degree do not take part in the triangular basis
+            return
+
+        def increment(basis, buffer):
+            buffer += delta * basis[:, term[0]]
+
+        def resync(basis, buffer):
+            np.matmul(basis, self.control_points[table_i, table_j].astype(np.float64), out=buffer)
+        self._samples.update(increment, resync)
+
+    def basis_matrix(self, u, v):
+        """
+        Numeric bivariate Bernstein basis of the surface's degree sampled at the points (u, v),
+        shared through a bounded cache keyed by degree and grid (see bbpi.bbcache.surface_basis_cache)
+
+        Parameters:
+            u (np.ndarray): 1-D array of parameters along the u-direction
+            v (np.ndarray): 1-D array of parameters along the v-direction
         Returns:
-            float: The point on the Bezier surface corresponding to the parameters (u, v).
+            read-only np.ndarray of shape (len(u), number of terms), with columns
+            ordered as in multinomial_table(degree)
+        """
+        u = np.atleast_1d(np.asarray(u, dtype=np.float64))
+        v = np.atleast_1d(np.asarray(v, dtype=np.float64))
+        return surface_basis_cache.lookup(self.degree, (u, v), bernstein_matrix2)
+
+    def _evaluate_symbolic(self, u, v):
+        """
+        Evaluates the Bezier surface through the symbolic Bernstein basis.
         """
+        if is_symbolic(u) and is_symbolic(v):
+            return self.expression(u, v)
+
         point = 0
         for i in range(self.degree + 1):
             for j in range(self.degree + 1):
                 point += self.control_points[i, j] * self.basis(i, j, self.degree, u, v)
         return point
 
+    def expression(self, u=None, v=None):
+        """
+        Symbolic polynomial of the surface in the variables u and v. It is built once per
+        pair of variables and kept until the control points change.
+
+        Parameters:
+            u (symbol): the u parameter, the symbol u by default
+            v (symbol): the v parameter, the symbol v by default
+        Returns:
+            sympy expression
+        """
+        from sympy import symbols
+        u = symbols('u') if u is None else u
+        v = symbols('v') if v is None else v
+        entry = self._symbolic.setdefault((u, v), [None, None])
+        if entry[0] is None:
+            i, j, _, _ = multinomial_table(self.degree)
+            entry[0] = sum(self.control_points[a, b] * self.basis(a, b, self.degree, u, v) for a, b in zip(i, j))
+        return entry[0]
+
+    def compile(self, u=None, v=None):
+        """
+        Compiles the symbolic polynomial of the surface into a vectorized NumPy function.
+        The function is built once per pair of variables and kept until the control points change.
+
+        Parameters:
+            u (symbol): the u parameter, the symbol u by default
+            v (symbol): the v parameter, the symbol v by default
+        Returns:
+            callable f(u_values, v_values, *values), where values are assigned to the free
+            symbols of the control points sorted by name
+        """
+        from sympy import symbols, lambdify
+        u = symbols('u') if u is None else u
+        v = symbols('v') if v is None else v
+        entry = self._symbolic.setdefault((u, v), [None, None])
+        if entry[1] is None:
+            expression = self.expression(u, v)
+            free = sorted(getattr(expression, 'free_symbols', set()) - {u, v}, key=str)
+            function = lambdify([u, v] + free, expression, 'numpy')
+
+            def compiled(u_values, v_values, *values):
+                u_values, v_values = np.broadcast_arrays(np.asarray(u_values, dtype=np.float64), np.asarray(v_values, dtype=np.float64))
+                # a constant surface comes back as a scalar, broadcast it over the points
+                return np.broadcast_to(np.asarray(function(u_values, v_values, *values), dtype=np.float64), u_values.shape).copy()
+
+            compiled.symbols = free
+            entry[1] = compiled
+        return entry[1]
+
+    def modify_control_point(self, i, j, value):
+        """
+        Modifies one coefficient of the Bezier surface.
+
+        Parameters:
+            i (int): Index of the coefficient along the u-direction.
+            j (int): Index of the coefficient along the v-direction.
+            value (float): The new value of the coefficient.
+        """
+        if 0 <= i <= self.degree and 0 <= j <= self.degree:
+            dtype = np.result_type(self._control_points, np.asarray(value))
+            if dtype != self._control_points.dtype:
+                # e.g. a float written into coefficients built from ints
+                self._control_points = self._control_points.astype(dtype)
+            old = self._control_points[i, j]
+            self._control_points[i, j] = value
+            self._symbolic = {}
+            if self._samples:
+                self._update_samples(i, j, float(self.control_points[i, j] - old))
+        else:
+            raise IndexError("Control point index is out of range.")
+
     def plot(self, num_points=100, grid=True, fig=(8, 6)):
         """
-        Plots the Bezier surface using matplotlib.
+        Plots the Bezier surface over its triangular domain using matplotlib.
 
         Parameters:
-            num_points (int): Number of points on the surface to calculate for plotting.
+            num_points (int): Number of points along each edge of the domain.
         """
-        u_values = np.linspace(0, 1, num_points)
-        v_values = np.linspace(0, 1, num_points)
-        U, V = np.meshgrid(u_values, v_values)
-        Z = np.array([[self.evaluate(u, v) for v in v_values] for u in u_values])
+        import matplotlib.pyplot as plt
+        from mpl_toolkits.mplot3d import Axes3D  # registers the 3d projection
+
+        vertices, indices = self.tessellate(max(1, num_points - 1))
         
         fig = plt.figure(figsize=fig)
         ax = fig.add_subplot(111, projection='3d')
-        ax.plot_surface(U, V, Z, cmap='viridis')
+        ax.plot_trisurf(vertices[:, 0], vertices[:, 1], vertices[:, 2], triangles=indices, cmap='viridis')
 
         ax.set_xlabel('u')
         ax.set_ylabel('v')
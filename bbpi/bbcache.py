@@ -0,0 +1,176 @@
+from collections import OrderedDict
+import threading
+import numpy as np
+
+# incremental sample updates between two full re-evaluations
+_RESYNC_EDITS = 1024
+
+
+def _fingerprint(grid):
+    """
+    Cheap key of a 1-D parameter grid: its length and a fixed number of probed values.
+    Different grids may share a fingerprint, so a hit is confirmed by comparing the grids.
+    """
+    step = max(1, grid.shape[0] // 16)
+    return grid.shape, grid[::step].tobytes(), grid[-1:].tobytes()
+
+
+class BasisCache:
+    def __init__(self, maxsize=64, min_points=16, max_points=1 << 16, max_bytes=32 << 20):
+        """
+        Bounded cache of numeric basis matrices keyed by degree and sample grid.
+        The least recently used matrix is evicted once maxsize matrices are stored or the
+        stored matrices and grids take more than max_bytes.
+
+        Grids are keyed by a fingerprint of a few of their values rather than a copy of
+        their bytes, so a lookup of a grid that is never seen again stays cheap. Grids
+        outside [min_points, max_points], scalars included, are built without a lookup and
+        counted as bypassed, so one-off evaluations do not evict the repeated grids.
+        Lookups may come from several threads; the entries and counters are guarded by a lock.
+
+        Parameters:
+            maxsize (int): maximum number of cached matrices
+            min_points (int): grids with fewer samples than this are built but not stored
+            max_points (int): grids with more samples than this are built but not stored
+            max_bytes (int): maximum memory held by the cache
+        """
+        self.maxsize = maxsize
+        self.min_points = min_points
+        self.max_points = max_points
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, degree, grids, build):
+        """
+        Returns the basis matrix of the given degree on the given grids, building it on a miss
+
+        Parameters:
+            degree (int): degree of the basis
+            grids (tuple of np.ndarray): 1-D float64 parameter arrays the matrix is sampled on
+            build (callable): build(degree, *grids) computing the matrix
+        Returns:
+            read-only np.ndarray
+        """
+        if not self.min_points <= grids[0].size <= self.max_points or self.maxsize <= 0:
+            with self._lock:
+                self.bypassed += 1
+            return build(degree, *grids)
+
+        key = (degree,) + tuple(_fingerprint(grid) for grid in grids)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and all(np.array_equal(a, b) for a, b in zip(entry[0], grids)):
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+
+        # built outside the lock, two threads missing the same grid both build it
+        matrix = build(degree, *grids)
+        matrix.setflags(write=False)
+        stored = tuple(grid.copy() for grid in grids)
+        size = matrix.nbytes + sum(grid.nbytes for grid in stored)
+        if size > self.max_bytes:
+            return matrix
+
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (stored, matrix, size)
+            self.nbytes += size
+            while len(self._entries) > self.maxsize or self.nbytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return matrix
+
+    def _drop(self, key):
+        # called with the lock held
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def info(self):
+        """
+        Returns the hit, miss and bypass counters and the current size of the cache as a dict
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'bypassed': self.bypassed,
+                    'size': len(self._entries), 'maxsize': self.maxsize,
+                    'nbytes': self.nbytes, 'max_bytes': self.max_bytes}
+
+    def clear(self):
+        """
+        Drops every cached matrix and resets the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.bypassed = 0
+
+
+class SampleCache:
+    def __init__(self, maxsize=8):
+        """
+        Per-object cache of sample buffers kept in sync with the coefficients. Each entry
+        holds the basis matrix of a sample grid and the buffer of values on it; edits of a
+        single coefficient are applied to the buffers in place instead of re-evaluating.
+        The least recently used grid is dropped once maxsize grids are stored.
+
+        Parameters:
+            maxsize (int): maximum number of cached sample grids
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, build):
+        """
+        Returns a read-only view of the samples stored under key
+
+        Parameters:
+            key (hashable): identifies the sample grid, e.g. its number of points
+            build (callable): build() returning (basis, buffer) on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            basis, buffer = build()
+            entry = self._entries[key] = [basis, buffer, 0]
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        view = entry[1].view()
+        view.flags.writeable = False
+        return view
+
+    def update(self, increment, resync):
+        """
+        Applies an edit of one coefficient to every buffer: increment(basis, buffer) adds
+        the change in place, and every _RESYNC_EDITS edits resync(basis, buffer) recomputes
+        the buffer instead, which bounds the rounding drift of repeated updates.
+        """
+        for entry in self._entries.values():
+            basis, buffer, edits = entry
+            if edits >= _RESYNC_EDITS:
+                resync(basis, buffer)
+                entry[2] = 0
+            else:
+                increment(basis, buffer)
+                entry[2] = edits + 1
+
+curve_basis_cache = BasisCache()
+surface_basis_cache = BasisCache(maxsize=16, max_points=1 << 14, max_bytes=16 << 20)
+
+
+def basis_cache_info():
+    """
+    Returns the counters of the curve and surface basis caches
+    """
+    return {'curve': curve_basis_cache.info(), 'surface': surface_basis_cache.info()}
@@ -0,0 +1,191 @@
+"""
+Binary container for collections of Bezier curves, and bulk writers for triangle meshes.
+
+Layout, little endian:
+
+    header   magic b'BBPI', uint32 version, uint64 number of curves      16 bytes
+    table    per curve: int32 degree, int32 dimension, int64 offset      16 bytes each
+    blob     float64 control points of every curve, row major (dimension, degree + 1)
+
+offset counts float64 values from the start of the blob. The blob starts on an 8 byte
+boundary, so it can be memory mapped and viewed without copying.
+"""
+import numpy as np
+from bbpi.bb1curve import BezierCurve
+from bbpi.bb1batch import BezierCurveBatch
+
+MAGIC = b'BBPI'
+VERSION = 1
+HEADER = np.dtype([('magic', 'S4'), ('version', '<u4'), ('count', '<u8')])
+ENTRY = np.dtype([('degree', '<i4'), ('dimension', '<i4'), ('offset', '<i8')])
+
+
+def save_curves(path, curves):
+    """
+    Writes curves to a binary curve library
+
+    Parameters:
+        path (str or path like): destination file
+        curves (list of BezierCurve or BezierCurveBatch): the curves to store, in order
+    """
+    if isinstance(curves, BezierCurveBatch):
+        n, dimension, size = curves.control_points.shape
+        table = np.zeros(n, dtype=ENTRY)
+        table['degree'] = size - 1
+        table['dimension'] = dimension
+        table['offset'] = np.arange(n) * dimension * size
+        blobs = [curves.control_points]
+    else:
+        curves = list(curves)
+        table = np.zeros(len(curves), dtype=ENTRY)
+        table['degree'] = [curve.degree for curve in curves]
+        table['dimension'] = [curve.dimension for curve in curves]
+        sizes = table['dimension'].astype(np.int64) * (table['degree'] + 1)
+        table['offset'] = np.cumsum(sizes) - sizes
+        blobs = [curve.control_points for curve in curves]
+
+    header = np.array([(MAGIC, VERSION, table.shape[0])], dtype=HEADER)
+    with open(path, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(table.tobytes())
+        for blob in blobs:
+            f.write(np.ascontiguousarray(blob, dtype='<f8').tobytes())
+
+
+class CurveLibrary:
+    def __init__(self, path, mode='r'):
+        """
+        Opens a binary curve library written by save_curves. Nothing is read up front beyond
+        the header: the table and the control points are memory mapped, and curves are
+        views of the mapped blob.
+
+        Parameters:
+            path (str or path like): the library file
+            mode (str): np.memmap mode; 'r' gives read-only curves, 'c' copy-on-write
+                curves that can be edited in memory and 'r+' writes edits back to the file
+        """
+        header = np.fromfile(path, dtype=HEADER, count=1)
+        if header.shape[0] != 1 or header['magic'][0] != MAGIC:
+            raise ValueError(f"{path} is not a bbpi curve library")
+        if header['version'][0] != VERSION:
+            raise ValueError(f"unsupported curve library version {header['version'][0]}, expected {VERSION}")
+
+        count = int(header['count'][0])
+        self.path = path
+        self.table = np.memmap(path, dtype=ENTRY, mode='r', offset=HEADER.itemsize, shape=(count,))
+        if count:
+            last = self.table[-1]
+            total = int(last['offset']) + int(last['dimension']) * (int(last['degree']) + 1)
+        else:
+            total = 0
+        offset = HEADER.itemsize + ENTRY.itemsize * count
+        self.blob = np.memmap(path, dtype='<f8', mode=mode, offset=offset, shape=(total,)) if total else np.empty(0)
+
+    def __len__(self):
+        return self.table.shape[0]
+
+    @property
+    def degrees(self):
+        return self.table['degree']
+
+    @property
+    def dimensions(self):
+        return self.table['dimension']
+
+    def __getitem__(self, index):
+        """
+        Returns curve index as a numeric BezierCurve viewing the mapped blob
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError("curve index is out of range.")
+        degree, dimension, offset = self.table[index].tolist()
+        points = self.blob[offset:offset + dimension * (degree + 1)].reshape(dimension, degree + 1)
+        return BezierCurve(points, numeric=True)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_batch(self, start=0, stop=None):
+        """
+        Returns the curves start..stop-1 as a BezierCurveBatch. They must share degree and
+        dimension; since they are stored back to back the batch views the mapped blob.
+        """
+        stop = len(self) if stop is None else stop
+        entries = self.table[start:stop]
+        if entries.shape[0] == 0:
+            raise ValueError("cannot build a batch from an empty range of curves")
+        degree, dimension = int(entries['degree'][0]), int(entries['dimension'][0])
+        if np.any(entries['degree'] != degree) or np.any(entries['dimension'] != dimension):
+            raise ValueError(f"curves {start}..{stop - 1} do not share one degree and dimension")
+        size = dimension * (degree + 1)
+        first = int(entries['offset'][0])
+        points = self.blob[first:first + entries.shape[0] * size]
+        return BezierCurveBatch(points.reshape(entries.shape[0], dimension, degree + 1))
+
+
+def load_curves(path, mode='r'):
+    """
+    Opens a binary curve library written by save_curves, see CurveLibrary
+
+    Returns:
+        CurveLibrary
+    """
+    return CurveLibrary(path, mode)
+
+
+def _mesh_arrays(vertices, indices):
+    vertices = np.asarray(vertices, dtype=np.float64)
+    indices = np.asarray(indices)
+    if vertices.ndim != 2 or vertices.shape[1] != 3 or indices.ndim != 2 or indices.shape[1] != 3:
+        raise ValueError(f"expected (n, 3) vertices and (m, 3) triangles, found {vertices.shape} and {indices.shape}")
+    return vertices, indices
+
+
+def write_ply(path, vertices, indices, dtype='<f4'):
+    """
+    Writes a triangle mesh, e.g. from BivariateBezierSurface.tessellate, as binary little endian PLY.
+    Vertices and faces are written as two packed blocks, without a Python loop over elements.
+
+    Parameters:
+        path (str or path like): destination file
+        vertices (np.ndarray): (n, 3) vertex positions
+        indices (np.ndarray): (m, 3) vertex indices of the triangles
+        dtype (str): '<f4' for float or '<f8' for double vertex coordinates
+    """
+    vertices, indices = _mesh_arrays(vertices, indices)
+    kind = {'<f4': 'float', '<f8': 'double'}.get(np.dtype(dtype).str)
+    if kind is None:
+        raise ValueError(f"vertex dtype must be '<f4' or '<f8', found {dtype}")
+    faces = np.empty(indices.shape[0], dtype=[('count', 'u1'), ('indices', '<i4', (3,))])
+    faces['count'] = 3
+    faces['indices'] = indices
+    header = (
+        'ply\nformat binary_little_endian 1.0\ncomment written by bbpi\n'
+        f'element vertex {vertices.shape[0]}\n'
+        f'property {kind} x\nproperty {kind} y\nproperty {kind} z\n'
+        f'element face {indices.shape[0]}\n'
+        'property list uchar int vertex_indices\nend_header\n'
+    )
+    with open(path, 'wb') as f:
+        f.write(header.encode('ascii'))
+        f.write(vertices.astype(dtype).tobytes())
+        f.write(faces.tobytes())
+
+
+def write_obj(path, vertices, indices):
+    """
+    Writes a triangle mesh as Wavefront OBJ. Each block of lines is formatted in a single
+    string operation.
+
+    Parameters:
+        path (str or path like): destination file
+        vertices (np.ndarray): (n, 3) vertex positions
+        indices (np.ndarray): (m, 3) zero based vertex indices of the triangles
+    """
+    vertices, indices = _mesh_arrays(vertices, indices)
+    with open(path, 'w') as f:
+        f.write('# written by bbpi\n')
+        f.write(('v %.9g %.9g %.9g\n' * vertices.shape[0]) % tuple(vertices.ravel().tolist()))
+        # OBJ indices start at 1
+        f.write(('f %d %d %d\n' * indices.shape[0]) % tuple((indices.ravel() + 1).tolist()))
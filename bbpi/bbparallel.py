@@ -0,0 +1,246 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from bbpi.bb1curve import bernstein_matrix
+from bbpi.bb2surface import bernstein_matrix2, multinomial_table
+
+
+def _curves_kernel(arrays, start, stop):
+    """
+    Evaluates the packed curves start..stop-1 into arrays['out']
+    """
+    blob, table, t, out = arrays['blob'], arrays['table'], arrays['t'], arrays['out']
+    dimension = out.shape[1]
+    bases = {}
+    for k in range(start, stop):
+        offset, degree = table[k]
+        if degree not in bases:
+            bases[degree] = bernstein_matrix(degree, t).T
+        points = blob[offset:offset + dimension * (degree + 1)].reshape(dimension, degree + 1)
+        np.matmul(points, bases[degree], out=out[k])
+
+
+def _surfaces_kernel(arrays, start, stop):
+    """
+    Evaluates the packed surfaces start..stop-1 into arrays['out']
+    """
+    blob, table, u, v, out = arrays['blob'], arrays['table'], arrays['u'], arrays['v'], arrays['out']
+    bases = {}
+    for k in range(start, stop):
+        offset, degree = table[k]
+        if degree not in bases:
+            bases[degree] = bernstein_matrix2(degree, u, v)
+        i, j, _, _ = multinomial_table(degree)
+        points = blob[offset:offset + (degree + 1)**2].reshape(degree + 1, degree + 1)
+        np.matmul(bases[degree], points[i, j], out=out[k])
+
+
+def _curve_grid_kernel(arrays, start, stop):
+    """
+    Evaluates one curve on the parameters start..stop-1 into arrays['out']
+    """
+    points = arrays['points']
+    t = arrays['t'][start:stop]
+    np.matmul(points, bernstein_matrix(points.shape[1] - 1, t).T, out=arrays['out'][:, start:stop])
+
+
+def _surface_grid_kernel(arrays, start, stop):
+    """
+    Evaluates one surface on the points start..stop-1 into arrays['out']
+    """
+    points = arrays['points']
+    degree = points.shape[0] - 1
+    i, j, _, _ = multinomial_table(degree)
+    basis = bernstein_matrix2(degree, arrays['u'][start:stop], arrays['v'][start:stop])
+    np.matmul(basis, points[i, j], out=arrays['out'][start:stop])
+
+
+_KERNELS = {
+    'curves': _curves_kernel,
+    'surfaces': _surfaces_kernel,
+    'curve_grid': _curve_grid_kernel,
+    'surface_grid': _surface_grid_kernel,
+}
+
+
+def _attach(name):
+    """
+    Attaches to a shared memory block created by the parent process. Pool workers share
+    the parent's resource tracker, and the parent unlinks the block when the call ends.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _worker(kind, layout, start, stop):
+    """
+    Process pool entry point: maps the shared arrays described by layout and runs a kernel
+    """
+    blocks = []
+    try:
+        arrays = {}
+        for key, (name, shape, dtype) in layout.items():
+            block = _attach(name)
+            blocks.append(block)
+            arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        _KERNELS[kind](arrays, start, stop)
+        del arrays
+    finally:
+        for block in blocks:
+            block.close()
+
+
+class ParallelExecutor:
+    def __init__(self, processes=None, min_items_per_task=1):
+        """
+        Evaluates many curves or surfaces, or one of them on a huge grid, over a process pool.
+
+        Inputs and outputs live in shared memory: control points are copied once into a
+        shared block instead of being pickled per task, and every task writes its slice of
+        one preallocated result array, so the output order never depends on scheduling.
+        With processes=1, when there is too little work to split, or when shared memory
+        is not available, everything runs in the calling process.
+
+        Parameters:
+            processes (int): number of worker processes, os.cpu_count() by default
+            min_items_per_task (int): smallest number of objects or samples handed to one task
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.min_items_per_task = max(1, min_items_per_task)
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Shuts the worker pool down
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _ranges(self, n):
+        tasks = max(1, min(self.processes * 4, n // self.min_items_per_task))
+        bounds = np.linspace(0, n, tasks + 1).astype(int)
+        return [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+    def _run(self, kind, arrays, n):
+        """
+        Runs a kernel over n items, returning arrays['out']
+        """
+        ranges = self._ranges(n)
+        if self.processes > 1 and len(ranges) > 1:
+            try:
+                return self._run_parallel(kind, arrays, ranges)
+            except OSError:
+                # no shared memory or process support here, the serial path gives the same result
+                pass
+        for start, stop in ranges:
+            _KERNELS[kind](arrays, start, stop)
+        return arrays['out']
+
+    def _run_parallel(self, kind, arrays, ranges):
+        """
+        Copies the inputs into shared memory and runs one pool task per range
+        """
+        blocks = []
+        shared = {}
+        try:
+            layout = {}
+            for key, array in arrays.items():
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                blocks.append(block)
+                shared[key] = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+                if key != 'out':
+                    shared[key][...] = array
+                layout[key] = (block.name, array.shape, array.dtype.str)
+
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.processes)
+            futures = [self._pool.submit(_worker, kind, layout, start, stop) for start, stop in ranges]
+            for future in futures:
+                future.result()
+            arrays['out'][...] = shared['out']
+            return arrays['out']
+        finally:
+            # views must be released before their blocks can be closed
+            shared.clear()
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def evaluate_curves(self, curves, t):
+        """
+        Evaluates many Bezier curves of the same dimension (any degrees) at the parameters t
+
+        Returns:
+            np.ndarray of shape (len(curves), dimension, len(t)), in the order of curves
+        """
+        curves = list(curves)
+        if not curves:
+            raise ValueError("no curves to evaluate")
+        dimension = curves[0].dimension
+        if any(curve.dimension != dimension for curve in curves):
+            raise ValueError(f"all curves must have dimension {dimension}")
+        t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+
+        sizes = [curve.control_points.size for curve in curves]
+        table = np.empty((len(curves), 2), dtype=np.int64)
+        table[:, 0] = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        table[:, 1] = [curve.degree for curve in curves]
+        blob = np.concatenate([curve.control_points.astype(np.float64, copy=False).ravel() for curve in curves])
+        out = np.empty((len(curves), dimension, t.shape[0]))
+        return self._run('curves', {'blob': blob, 'table': table, 't': t, 'out': out}, len(curves))
+
+    def evaluate_surfaces(self, surfaces, u, v):
+        """
+        Evaluates many bivariate Bezier surfaces at the barycentric points (u, v)
+
+        Returns:
+            np.ndarray of shape (len(surfaces), len(u)), in the order of surfaces
+        """
+        surfaces = list(surfaces)
+        if not surfaces:
+            raise ValueError("no surfaces to evaluate")
+        u = np.atleast_1d(np.asarray(u, dtype=np.float64))
+        v = np.atleast_1d(np.asarray(v, dtype=np.float64))
+
+        sizes = [surface.control_points.size for surface in surfaces]
+        table = np.empty((len(surfaces), 2), dtype=np.int64)
+        table[:, 0] = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        table[:, 1] = [surface.degree for surface in surfaces]
+        blob = np.concatenate([surface.control_points.astype(np.float64).ravel() for surface in surfaces])
+        out = np.empty((len(surfaces), u.shape[0]))
+        return self._run('surfaces', {'blob': blob, 'table': table, 'u': u, 'v': v, 'out': out}, len(surfaces))
+
+    def evaluate_curve(self, curve, t):
+        """
+        Evaluates one Bezier curve on a large parameter grid split across the workers
+
+        Returns:
+            np.ndarray of shape (dimension, len(t))
+        """
+        t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+        points = curve.control_points.astype(np.float64)
+        out = np.empty((curve.dimension, t.shape[0]))
+        return self._run('curve_grid', {'points': points, 't': t, 'out': out}, t.shape[0])
+
+    def evaluate_surface(self, surface, u, v):
+        """
+        Evaluates one bivariate Bezier surface on a large set of points split across the workers
+
+        Returns:
+            np.ndarray of shape (len(u),)
+        """
+        u = np.atleast_1d(np.asarray(u, dtype=np.float64))
+        v = np.atleast_1d(np.asarray(v, dtype=np.float64))
+        points = surface.control_points.astype(np.float64)
+        out = np.empty(u.shape[0])
+        return self._run('surface_grid', {'points': points, 'u': u, 'v': v, 'out': out}, u.shape[0])
@@ -0,0 +1,169 @@
+"""
+Opt-in instrumentation of the bbpi hot paths.
+
+Instrumented operations count their calls, cumulative and worst wall time and the sizes
+of their inputs (degree, dimension, number of samples). Recording is off by default; a
+disabled operation costs one flag check on top of the call.
+
+    from bbpi import bbprofile
+
+    with bbprofile.profiling() as stats:
+        curve.evaluate(t)
+    stats['operations']['BezierCurve.evaluate']['calls']
+
+    bbprofile.enable()
+    ...
+    print(bbprofile.export('prometheus'))
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+_enabled = False
+_lock = threading.Lock()
+_stats = {}
+
+
+def instrumented(name, sizes=None):
+    """
+    Decorator recording the calls of an operation under name while profiling is enabled
+
+    Parameters:
+        name (str): operation name in the snapshot
+        sizes (callable): sizes(*args, **kwargs) returning a dict of input sizes, called
+            with the arguments of the operation before it runs
+    """
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            measured = sizes(*args, **kwargs) if sizes is not None else {}
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, time.perf_counter() - start, measured)
+        return wrapper
+    return decorate
+
+
+def _record(name, seconds, sizes):
+    with _lock:
+        entry = _stats.get(name)
+        if entry is None:
+            entry = _stats[name] = {'calls': 0, 'seconds': 0.0, 'seconds_max': 0.0}
+        entry['calls'] += 1
+        entry['seconds'] += seconds
+        entry['seconds_max'] = max(entry['seconds_max'], seconds)
+        for key, value in sizes.items():
+            entry[key + '_total'] = entry.get(key + '_total', 0) + value
+            entry[key + '_max'] = max(entry.get(key + '_max', value), value)
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """
+    Drops the recorded operation statistics. Cache counters belong to the caches and are kept.
+    """
+    with _lock:
+        _stats.clear()
+
+
+def _cache_stats():
+    # imported here: the instrumented modules import this one
+    from .bbcache import curve_basis_cache, surface_basis_cache
+    from .bb1curve import power_matrix
+    from .bb1utilities import product_weights, binomial_row, elevation_matrix, reduction_matrix
+    from .bb2surface import multinomial_table, triangle_grid, triangle_indices
+
+    caches = {'curve_basis': curve_basis_cache.info(), 'surface_basis': surface_basis_cache.info()}
+    for name, function in (('product_weights', product_weights), ('binomial_row', binomial_row),
+                           ('elevation_matrix', elevation_matrix), ('reduction_matrix', reduction_matrix),
+                           ('power_matrix', power_matrix), ('multinomial_table', multinomial_table),
+                           ('triangle_grid', triangle_grid), ('triangle_indices', triangle_indices)):
+        info = function.cache_info()
+        caches[name] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+    for info in caches.values():
+        lookups = info['hits'] + info['misses']
+        info['hit_rate'] = info['hits'] / lookups if lookups else 0.0
+    return caches
+
+
+def snapshot():
+    """
+    Returns a copy of the recorded statistics
+
+    Returns:
+        dict with 'enabled', 'operations' (name -> calls, seconds, seconds_max and
+        <size>_total / <size>_max per input size) and 'caches' (name -> hits, misses,
+        size, maxsize, hit_rate)
+    """
+    with _lock:
+        operations = {name: dict(entry) for name, entry in _stats.items()}
+    return {'enabled': _enabled, 'operations': operations, 'caches': _cache_stats()}
+
+
+def export(fmt='json'):
+    """
+    Serializes a snapshot for a metrics collector
+
+    Parameters:
+        fmt (str): 'json' or 'prometheus' (text exposition format)
+    Returns:
+        str
+    """
+    data = snapshot()
+    if fmt == 'json':
+        return json.dumps(data, indent=2, sort_keys=True)
+    if fmt != 'prometheus':
+        raise ValueError(f"unknown export format {fmt!r}, expected 'json' or 'prometheus'")
+
+    lines = []
+    for name, entry in sorted(data['operations'].items()):
+        for key, value in sorted(entry.items()):
+            metric = 'bbpi_' + key + ('_total' if key in ('calls', 'seconds') else '')
+            lines.append(f'{metric}{{operation="{name}"}} {value}')
+    for name, info in sorted(data['caches'].items()):
+        lines.append(f'bbpi_cache_hits_total{{cache="{name}"}} {info["hits"]}')
+        lines.append(f'bbpi_cache_misses_total{{cache="{name}"}} {info["misses"]}')
+        lines.append(f'bbpi_cache_size{{cache="{name}"}} {info["size"]}')
+        lines.append(f'bbpi_cache_hit_rate{{cache="{name}"}} {info["hit_rate"]}')
+    return '\n'.join(lines) + '\n'
+
+
+@contextmanager
+def profiling(reset_stats=True):
+    """
+    Enables profiling for the duration of the block. The yielded dict is filled with the
+    snapshot when the block exits, and the previous enabled state is restored.
+
+    Parameters:
+        reset_stats (bool): drop the statistics recorded before the block
+    """
+    global _enabled
+    previous = _enabled
+    if reset_stats:
+        reset()
+    result = {}
+    _enabled = True
+    try:
+        yield result
+    finally:
+        _enabled = previous
+        result.update(snapshot())
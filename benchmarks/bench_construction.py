@@ -0,0 +1,59 @@
+"""
+Measures how many BezierCurve objects can be built per second.
+
+"eager" forces the symbolic coefficients on every curve, which is what every
+constructor used to do; "lazy" is the default constructor and "numeric" the
+float64 mode.
+
+    python -m benchmarks.bench_construction [--curves N] [--degree D] [--dimension M]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from bbpi import BezierCurve
+
+
+def build_eager(points):
+    for p in points:
+        BezierCurve(p).b
+
+
+def build_lazy(points):
+    for p in points:
+        BezierCurve(p)
+
+
+def build_numeric(points):
+    for p in points:
+        BezierCurve(p, numeric=True)
+
+
+def curves_per_second(build, points, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(points)
+        best = min(best, time.perf_counter() - start)
+    return len(points) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--curves', type=int, default=20000)
+    parser.add_argument('--degree', type=int, default=3)
+    parser.add_argument('--dimension', type=int, default=2)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    points = list(rng.random((args.curves, args.dimension, args.degree + 1)))
+
+    results = {name: curves_per_second(build, points) for name, build in
+               (('eager', build_eager), ('lazy', build_lazy), ('numeric', build_numeric))}
+    for name, rate in results.items():
+        print(f"{name:>8}: {rate:12,.0f} curves/s  ({rate / results['eager']:.1f}x eager)")
+
+
+if __name__ == '__main__':
+    main()
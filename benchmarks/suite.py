@@ -0,0 +1,166 @@
+"""
+Benchmark suite for the public operations of bbpi.
+
+Every case is timed over a grid of degree, dimension and sample count. Results can be
+saved as a JSON baseline and later runs compared against it; the comparison fails
+(exit status 1) when any case is slower than the baseline by more than the threshold.
+
+    python -m benchmarks.suite --save benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 1.5
+    python -m benchmarks.suite --filter multiply --quick
+"""
+import argparse
+import itertools
+import json
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+from bbpi import BezierCurve, BivariateBezierSurface
+from bbpi import add, multiply, degree_raise, subdivide, derivative
+
+DEGREES = (3, 7, 15)
+DIMENSIONS = (1, 2, 3)
+SAMPLES = (100, 10000)
+
+
+def _curve(degree, dimension, seed=0):
+    return BezierCurve(np.random.default_rng(seed).random((dimension, degree + 1)))
+
+
+def bench_construction(degree, dimension):
+    points = np.random.default_rng(0).random((dimension, degree + 1))
+    return lambda: BezierCurve(points)
+
+
+def bench_evaluate(degree, dimension, samples):
+    curve = _curve(degree, dimension)
+    t = np.linspace(0, 1, samples)
+    return lambda: curve.evaluate(t)
+
+
+def bench_add(degree, dimension):
+    curve1, curve2 = _curve(degree, dimension, 0), _curve(degree, dimension, 1)
+    return lambda: add(curve1, curve2)
+
+
+def bench_multiply(degree, dimension):
+    curve1, curve2 = _curve(degree, dimension, 0), _curve(degree, dimension, 1)
+    return lambda: multiply(curve1, curve2)
+
+
+def bench_degree_raise(degree, dimension):
+    curve = _curve(degree, dimension)
+    return lambda: degree_raise(curve)
+
+
+def bench_subdivide(degree, dimension):
+    curve = _curve(degree, dimension)
+    return lambda: subdivide(curve, 0.3)
+
+
+def bench_derivative(degree, dimension):
+    points = np.random.default_rng(0).random((dimension, degree + 1))
+    return lambda: derivative(BezierCurve(points))
+
+
+def bench_surface_evaluate(degree, samples):
+    surface = BivariateBezierSurface(np.random.default_rng(0).random((degree + 1, degree + 1)))
+    u = np.random.default_rng(1).random(samples) / 2
+    v = np.random.default_rng(2).random(samples) / 2
+    return lambda: surface.evaluate(u, v)
+
+
+# name -> (setup, parameter grid); setup(**params) returns the callable to time
+CASES = {
+    'construction': (bench_construction, {'degree': DEGREES, 'dimension': DIMENSIONS}),
+    'evaluate': (bench_evaluate, {'degree': DEGREES, 'dimension': DIMENSIONS, 'samples': SAMPLES}),
+    'add': (bench_add, {'degree': DEGREES, 'dimension': DIMENSIONS}),
+    'multiply': (bench_multiply, {'degree': DEGREES, 'dimension': DIMENSIONS}),
+    'degree_raise': (bench_degree_raise, {'degree': DEGREES, 'dimension': DIMENSIONS}),
+    'subdivide': (bench_subdivide, {'degree': DEGREES, 'dimension': DIMENSIONS}),
+    'derivative': (bench_derivative, {'degree': DEGREES, 'dimension': DIMENSIONS}),
+    'surface_evaluate': (bench_surface_evaluate, {'degree': (2, 4, 8), 'samples': SAMPLES}),
+}
+
+
+def case_ids(pattern=None, quick=False):
+    """
+    Yields (key, name, params) for every benchmark case, key being a stable string id
+    """
+    for name, (_, grid) in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        values = [v[:1] if quick else v for v in grid.values()]
+        for combination in itertools.product(*values):
+            params = dict(zip(grid, combination))
+            key = name + '[' + ','.join(f'{k}={v}' for k, v in params.items()) + ']'
+            yield key, name, params
+
+
+def time_case(name, params, repeat=5, min_time=0.05):
+    """
+    Returns the best time per call in seconds, timeit style
+    """
+    timer = timeit.Timer(CASES[name][0](**params))
+    number = 1
+    while timer.timeit(number) < min_time and number < 1 << 20:
+        number *= 4
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(pattern=None, quick=False, repeat=5, min_time=0.05, out=sys.stdout):
+    results = {}
+    for key, name, params in case_ids(pattern, quick):
+        results[key] = time_case(name, params, repeat, min_time)
+        print(f"{key:<60} {results[key] * 1e6:14.2f} us", file=out)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares results to baseline timings
+
+    Returns:
+        list of (key, baseline time, new time, ratio) for the cases slower than threshold times the baseline
+    """
+    slower = []
+    for key, seconds in results.items():
+        if key in baseline and seconds > threshold * baseline[key]:
+            slower.append((key, baseline[key], seconds, seconds / baseline[key]))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', help='only run cases whose name contains this string')
+    parser.add_argument('--quick', action='store_true', help='only the first value of every parameter')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.05, help='minimum seconds per timing run')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='JSON baseline to compare against')
+    parser.add_argument('--threshold', type=float, default=1.5, help='allowed slowdown ratio against the baseline')
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.quick, args.repeat, args.min_time)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'machine': platform.platform(), 'python': platform.python_version(),
+                       'numpy': np.__version__, 'results': results}, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        slower = compare(results, baseline, args.threshold)
+        for key, before, after, ratio in slower:
+            print(f"SLOWER {key}: {before * 1e6:.2f} us -> {after * 1e6:.2f} us ({ratio:.2f}x)")
+        if slower:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
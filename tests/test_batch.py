@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from bbpi import BezierCurve, BezierCurveBatch
+from bbpi import add, multiply, degree_raise, subdivide, derivative
+
+rng = np.random.default_rng(1)
+
+def make_batch(n=5, dimension=2, degree=3):
+    return BezierCurveBatch(rng.random((n, dimension, degree + 1)))
+
+def test_derivative_degree_zero():
+    batch = make_batch(degree=0)
+    assert batch.derivative().control_points.shape == (5, 2, 1)
+    assert np.all(batch.derivative().control_points == 0)
+    assert np.array_equal(batch.derivative()[0].control_points, derivative(batch[0]).control_points)
+
+def test_round_trip():
+    batch = make_batch()
+    curves = batch.to_curves()
+    assert len(curves) == 5
+    assert np.shares_memory(curves[2].control_points, batch.control_points)
+    again = BezierCurveBatch.from_curves(curves)
+    assert np.array_equal(again.control_points, batch.control_points)
+
+def test_from_curves_mismatch():
+    with pytest.raises(ValueError):
+        BezierCurveBatch.from_curves([BezierCurve([1,2,3]), BezierCurve([1,2])])
+
+def test_evaluate():
+    batch = make_batch()
+    t = np.linspace(0, 1, 9)
+    eval = batch.evaluate(t)
+    assert eval.shape == (5, 2, 9)
+    for curve, points in zip(batch.to_curves(), eval):
+        assert np.allclose(curve.evaluate(t), points)
+
+def test_operations_match_utilities():
+    batch = make_batch(dimension=1)
+    other = make_batch(dimension=1, degree=2)
+    same = make_batch(dimension=1)
+    for i, curve in enumerate(batch.to_curves()):
+        assert np.allclose(batch.add(same)[i].control_points, add(curve, same[i]).control_points)
+        assert np.allclose(batch.multiply(other)[i].control_points, multiply(curve, other[i]).control_points.astype(float))
+        assert np.allclose(batch.degree_raise()[i].control_points, degree_raise(curve).control_points)
+        assert np.allclose(batch.derivative()[i].control_points, derivative(BezierCurve(curve.control_points.copy())).control_points)
+        left, right = subdivide(curve, 0.3)
+        bl, br = batch.subdivide(0.3)
+        assert np.allclose(bl[i].control_points, left.control_points)
+        assert np.allclose(br[i].control_points, right.control_points)
+
+def test_subdivide_per_curve_parameter():
+    batch = make_batch()
+    s = np.linspace(0.1, 0.9, 5)
+    left, right = batch.subdivide(s)
+    for i in range(5):
+        assert np.allclose(left.evaluate(1.0)[i], batch.evaluate(s[i])[i])
+        assert np.allclose(right.evaluate(0.0)[i], batch.evaluate(s[i])[i])
+
+def test_split_at():
+    batch = make_batch()
+    ts = np.array([[0.2, 0.6]] * 4 + [[0.0, 1.0]])
+    pieces = batch.split_at(ts)
+    assert len(pieces) == 3
+    t = np.linspace(0, 1, 5)
+    for k, piece in enumerate(pieces):
+        a, b = np.hstack([0, ts[0]])[k], np.hstack([ts[0], 1])[k]
+        assert np.allclose(piece.evaluate(t)[0], batch[0].evaluate(a + (b - a) * t))
+    assert np.allclose(pieces[1][4].control_points, batch[4].control_points)
+
+def test_elevate_and_mixed_add():
+    low = make_batch(degree=2)
+    high = make_batch(degree=5)
+    t = np.linspace(0, 1, 7)
+    assert np.allclose(low.elevate(3).evaluate(t), low.evaluate(t))
+    assert np.allclose(low.elevate(3).reduce_degree(3).control_points, low.control_points)
+    assert np.allclose(low.add(high).evaluate(t), low.evaluate(t) + high.evaluate(t))
+    assert np.allclose(high.add(low).control_points, low.add(high).control_points)
@@ -0,0 +1,11 @@
+from benchmarks.suite import case_ids, compare, time_case, CASES
+
+def test_every_case_runs():
+    for key, name, params in case_ids(quick=True):
+        assert time_case(name, params, repeat=1, min_time=0) > 0
+    assert {name for _, name, _ in case_ids(quick=True)} == set(CASES)
+
+def test_compare():
+    baseline = {'a': 1.0, 'b': 1.0}
+    results = {'a': 1.2, 'b': 2.0, 'c': 5.0}
+    assert compare(results, baseline, 1.5) == [('b', 1.0, 2.0, 2.0)]
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from fractions import Fraction
+from sympy import symbols
+from bbpi import BezierCurve, derivative, integral
+from bbpi import hodograph, arc_length, arc_length_table, arc_length_parameter, sample_arc_length
+
+def test_derivative_does_not_mutate():
+    curve = BezierCurve([[0, 1, 3, 4], [0, 2, 2, 0]])
+    points = curve.control_points.copy()
+    first = derivative(curve)
+    assert np.array_equal(curve.control_points, points)
+    assert np.array_equal(first.control_points, [[3, 6, 3], [6, 0, -6]])
+    assert hodograph(curve) is hodograph(curve)
+    assert np.array_equal(hodograph(curve, 2), derivative(first).control_points)
+    assert np.array_equal(hodograph(curve, 5), [[0], [0]])
+
+def test_hodograph_invalidated():
+    curve = BezierCurve([0, 1, 3])
+    assert np.array_equal(hodograph(curve), [[2, 4]])
+    curve.modify_control_point(2, 1)
+    assert np.array_equal(hodograph(curve), [[2, 0]])
+    curve.add_control_point(4)
+    assert np.array_equal(hodograph(curve), [[3, 0, 9]])
+
+def test_integral():
+    curve = BezierCurve([[1, 3, -2, 5], [0, 1, 0, 1]])
+    antiderivative = integral(curve, constant=[2, 0])
+    assert antiderivative.degree == 4
+    assert np.allclose(derivative(antiderivative).control_points, curve.control_points)
+    assert np.allclose(antiderivative.evaluate(0.0)[:, 0], [2, 0])
+    exact = integral(BezierCurve([1, Fraction(1, 2), 2]))
+    assert exact.control_points.tolist() == [[0, Fraction(1, 3), Fraction(1, 2), Fraction(7, 6)]]
+    a = symbols('a')
+    assert integral(BezierCurve([a, 1])).control_points[0, 2] == a / 2 + Fraction(1, 2)
+
+def test_arc_length():
+    line = BezierCurve([[0, 1, 2, 3], [0, 1, 2, 3]])
+    assert np.isclose(arc_length(line), 3 * np.sqrt(2))
+    assert np.allclose(arc_length(line, [0.0, 0.5, 1.0]), [0, 1.5 * np.sqrt(2), 3 * np.sqrt(2)])
+
+    circle = BezierCurve([[1, 1, 0], [0, 1, 1]])  # not a circle, compare with dense sampling
+    t = np.linspace(0, 1, 200001)
+    points = circle.evaluate(t)
+    reference = np.linalg.norm(np.diff(points, axis=1), axis=0).sum()
+    assert np.isclose(arc_length(circle), reference, rtol=1e-8)
+    _, s = arc_length_table(circle)
+    assert np.isclose(s[-1], reference, rtol=1e-8) and np.all(np.diff(s) > 0)
+
+def test_constant_speed():
+    curve = BezierCurve([[0, 0, 4, 4], [0, 3, 3, 0]])
+    length = arc_length(curve)
+    s = np.linspace(0, length, 33)
+    t = arc_length_parameter(curve, s)
+    assert t[0] == 0 and np.isclose(t[-1], 1)
+    assert np.allclose(arc_length(curve, t), s, atol=1e-9 * length)
+    points = sample_arc_length(curve, 17)
+    steps = np.linalg.norm(np.diff(points, axis=1), axis=0)
+    assert np.allclose(steps, steps.mean(), rtol=1e-3)
+
+def test_cusp():
+    # zero speed at t = 0.5: the inverse stays monotone, with reduced accuracy next to the cusp
+    curve = BezierCurve([[0, 1, 0, 1], [0, 1, 1, 0]])
+    s = np.linspace(0, arc_length(curve), 50)
+    t = arc_length_parameter(curve, s)
+    assert np.all(np.diff(t) > 0)
+    assert np.allclose(arc_length(curve, t, segments=64), s, atol=1e-4)
@@ -85,3 +85,191 @@ def test_3dplot():
     curve = BezierCurve([[2,2,0,-2,-2],[0,1,2,1,0],[1,2,3,4,5]])
     curve.plot3D()
     assert False
+
+def test_evaluate_vectorized():
+    curve = BezierCurve([[2,2,0,-2,-2],[0,1,2,1,0]])
+    t = np.linspace(0, 1, 7)
+    eval = curve.evaluate(t)
+    expected = np.hstack([curve._evaluate_symbolic(x) for x in t])
+    assert eval.shape == (2, 7)
+    assert np.allclose(eval, expected)
+
+def test_evaluate_symbolic():
+    u = symbols('u')
+    curve = BezierCurve([1,0,1])
+    eval = curve.evaluate(u)
+    assert eval.shape == (1, 1)
+    assert (eval[0][0] - ((1-u)**2 + u**2)).expand() == 0
+
+def test_lazy_symbols():
+    curve = BezierCurve([[1,2,3],[4,5,6]], var='c')
+    assert curve._b is None
+    assert curve.b[1][2] == symbols('c_1_2')
+    assert curve._b is curve.b
+
+def test_numeric_mode():
+    points = np.array([[1.0,2.0,3.0],[4.0,5.0,6.0]])
+    curve = BezierCurve(points, numeric=True)
+    assert curve._control_points is points and np.shares_memory(curve.control_points, points)
+    curve = BezierCurve([[1,2,3],[4,5,6]], numeric=True)
+    assert curve.control_points.dtype == np.float64
+    assert curve.control_points.flags['C_CONTIGUOUS']
+    with pytest.raises(AttributeError):
+        curve.extra = 1
+
+def test_basis_cache():
+    from bbpi.bbcache import curve_basis_cache
+    curve_basis_cache.clear()
+    curve = BezierCurve([[2,2,0,-2,-2],[0,1,2,1,0]])
+    t = np.linspace(0, 1, 50)
+    first = curve.evaluate(t)
+    second = BezierCurve([[1,2,3,4,5]]).evaluate(np.linspace(0, 1, 50))
+    assert curve_basis_cache.info()['hits'] == 1
+    assert curve_basis_cache.info()['misses'] == 1
+    assert curve.basis_matrix(t).shape == (50, 5)
+    assert not curve.basis_matrix(t).flags.writeable
+    assert np.allclose(second[0], 1 + 4 * t)
+
+def test_basis_cache_bytes():
+    from bbpi.bbcache import BasisCache
+    from bbpi.bb1curve import bernstein_matrix
+    cache = BasisCache(max_bytes=1 << 20)
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        cache.lookup(20, (rng.random(2000),), bernstein_matrix)
+    assert cache.info()['nbytes'] <= 1 << 20
+    assert cache.info()['size'] == (1 << 20) // (2000 * 22 * 8)
+    # same length and probed values, different grid: the fingerprint collides, the lookup does not
+    a = np.linspace(0, 1, 100)
+    b = a.copy()
+    b[1] = 0.5
+    cache.lookup(3, (a,), bernstein_matrix)
+    assert np.allclose(cache.lookup(3, (b,), bernstein_matrix), bernstein_matrix(3, b))
+    assert cache.info()['hits'] == 0
+
+def test_basis_cache_bypass():
+    from bbpi.bbcache import curve_basis_cache
+    curve_basis_cache.clear()
+    curve = BezierCurve([[2,2,0,-2,-2],[0,1,2,1,0]])
+    t = np.linspace(0, 1, 50)
+    curve.evaluate(t)
+    for x in np.linspace(0, 1, 100):
+        curve.evaluate(x)
+    curve.evaluate(t)
+    info = curve_basis_cache.info()
+    assert (info['hits'], info['misses'], info['bypassed'], info['size']) == (1, 1, 100, 1)
+
+def test_basis_cache_threads():
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+    from bbpi.bbcache import BasisCache
+    from bbpi.bb1curve import bernstein_matrix
+    cache = BasisCache(maxsize=4)
+    grids = [np.linspace(0, 1, n) for n in range(20, 40)]
+
+    def work(seed):
+        rng = np.random.default_rng(seed)
+        for k in rng.integers(0, len(grids), 500):
+            assert np.allclose(cache.lookup(3, (grids[k],), bernstein_matrix).sum(axis=1), 1)
+
+    interval = sys.getswitchinterval()
+    # switch threads often, so they interleave inside lookup
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(work, range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+    info = cache.info()
+    assert info['hits'] + info['misses'] == 8 * 500
+    assert info['size'] <= 4
+
+def test_iter_evaluate(tmp_path):
+    curve = BezierCurve([[2,2,0,-2,-2],[0,1,2,1,0]])
+    t = np.linspace(0, 1, 1001)
+    chunks = list(curve.iter_evaluate(t, chunk_size=300))
+    assert [c.shape[1] for c in chunks] == [300, 300, 300, 101]
+    assert np.allclose(np.hstack(chunks), curve.evaluate(t))
+
+    generated = list(curve.iter_evaluate((x / 1000 for x in range(1001)), chunk_size=256))
+    assert np.allclose(np.hstack(generated), curve.evaluate(t))
+
+    source = np.memmap(tmp_path / 't.bin', dtype=np.float64, mode='w+', shape=t.shape)
+    source[:] = t
+    out = np.memmap(tmp_path / 'out.bin', dtype=np.float64, mode='w+', shape=(2, 1001))
+    for chunk in curve.iter_evaluate(source, chunk_size=128, out=out):
+        assert np.shares_memory(chunk, out)
+    assert np.allclose(out, curve.evaluate(t))
+
+def test_compile_cache():
+    curve = BezierCurve([[1.0,2,3],[0,1,0]])
+    t = np.linspace(0, 1, 5)
+    compiled = curve.compile()
+    assert curve.compile() is compiled
+    assert np.allclose(compiled(t), curve.evaluate(t))
+    curve.modify_control_point(1, [5, 5])
+    assert np.allclose(curve.control_points[:, 1], [5, 5])
+    assert curve.compile() is not compiled
+    assert np.allclose(curve.compile()(t), curve.evaluate(t))
+    curve.add_control_point([7, 7])
+    assert curve.degree == 3
+    assert np.allclose(curve.compile()(t), curve.evaluate(t))
+
+def test_modify_int_points():
+    curve = BezierCurve([[0,1,2],[0,1,0]])
+    samples = curve.sample(5)
+    curve.modify_control_point(1, [0.5, 0.25])
+    assert np.allclose(curve.control_points[:, 1], [0.5, 0.25])
+    assert np.allclose(samples, curve.evaluate(np.linspace(0, 1, 5)))
+
+def test_pickle_after_compile():
+    import pickle
+    from bbpi.bb1calculus import hodograph
+    curve = BezierCurve([[1.0,2,3],[0,1,0]], var='c')
+    curve.compile()
+    curve.sample(50)
+    hodograph(curve)
+    copy = pickle.loads(pickle.dumps(curve))
+    assert copy._symbolic is None and copy._samples is None and copy._derived is None
+    assert np.array_equal(copy.control_points, curve.control_points)
+    assert copy.b[0][0].name.startswith('c')
+    assert np.allclose(copy.compile()(np.linspace(0, 1, 5)), curve.sample(5))
+
+def test_compile_symbolic_coefficients():
+    a, b = symbols('a b')
+    compiled = BezierCurve([a, b, 1]).compile()
+    t = np.linspace(0, 1, 5)
+    assert compiled.symbols == [a, b]
+    assert np.allclose(compiled(t, 2.0, 3.0), BezierCurve([2, 3, 1]).evaluate(t))
+
+def test_incremental_samples():
+    curve = BezierCurve(np.random.default_rng(0).random((2, 21)))
+    samples = curve.sample(200)
+    assert not samples.flags.writeable
+    for index in (0, 7, 20):
+        curve.modify_control_point(index, [index, -index])
+    assert np.allclose(samples, curve.evaluate(np.linspace(0, 1, 200)))
+    # in-place writes would bypass the cached samples
+    with pytest.raises(ValueError):
+        curve.control_points[1, 1] = 5
+    curve.add_control_point([1, 1])
+    assert curve.sample(200).shape == (2, 200)
+    assert np.allclose(curve.sample(200), curve.evaluate(np.linspace(0, 1, 200)))
+
+def test_sample_cache_bounded():
+    curve = BezierCurve(np.random.default_rng(0).random((2, 6)))
+    for n in range(10, 40):
+        curve.sample(n)
+    assert len(curve._samples) == curve._samples.maxsize
+    curve.modify_control_point(2, [5, 5])
+    assert np.allclose(curve.sample(39), curve.evaluate(np.linspace(0, 1, 39)))
+
+def test_sample_uniform():
+    from bbpi.bb1curve import de_casteljau
+    rng = np.random.default_rng(0)
+    for degree in (0, 1, 3, 8, 20):
+        curve = BezierCurve(rng.random((3, degree + 1)))
+        t = np.linspace(0, 1, 301)
+        assert np.allclose(curve.sample_uniform(301), curve.evaluate(t))
+        assert np.allclose(de_casteljau(curve.control_points, t), curve.evaluate(t))
+    assert curve.sample_uniform(0).shape == (3, 0)
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import os
+
+# cumulative import time of the bbpi package in microseconds, about twice the measured
+# time: numpy included, and on its own with numpy already imported
+IMPORT_BUDGET_US = 300_000
+OWN_IMPORT_BUDGET_US = 80_000
+
+def import_times(code='import bbpi'):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=root, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+def test_import_skips_heavy_backends():
+    times = import_times()
+    assert 'bbpi' in times
+    assert not any(name.split('.')[0] in ('sympy', 'matplotlib', 'mpl_toolkits') for name in times)
+
+def test_import_budget():
+    # best of three to keep a cold disk cache from failing the run
+    best = min(import_times()['bbpi'] for _ in range(3))
+    assert best < IMPORT_BUDGET_US, f"import bbpi took {best} us, budget is {IMPORT_BUDGET_US} us"
+    own = min(import_times('import numpy; import bbpi')['bbpi'] for _ in range(3))
+    assert own < OWN_IMPORT_BUDGET_US, f"import bbpi without numpy took {own} us, budget is {OWN_IMPORT_BUDGET_US} us"
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from bbpi import BezierCurve, BezierCurveBatch, save_curves, load_curves
+
+rng = np.random.default_rng(4)
+
+def test_round_trip(tmp_path):
+    curves = [BezierCurve(rng.random((2, 4))), BezierCurve(rng.random((3, 6))), BezierCurve([1, 2, 3])]
+    path = tmp_path / 'curves.bbpi'
+    save_curves(path, curves)
+    library = load_curves(path)
+    assert len(library) == 3
+    assert list(library.degrees) == [3, 5, 2]
+    assert list(library.dimensions) == [2, 3, 1]
+    for curve, loaded in zip(curves, library):
+        assert loaded.numeric
+        assert np.array_equal(np.asarray(curve.control_points, dtype=float), loaded.control_points)
+    t = np.linspace(0, 1, 7)
+    assert np.allclose(library[-2].evaluate(t), curves[1].evaluate(t))
+    with pytest.raises(IndexError):
+        library[3]
+
+def test_zero_copy(tmp_path):
+    path = tmp_path / 'curves.bbpi'
+    save_curves(path, BezierCurveBatch(rng.random((10, 2, 4))))
+    library = load_curves(path)
+    assert np.shares_memory(library[4].control_points, library.blob)
+    batch = library.to_batch(2, 6)
+    assert batch.control_points.shape == (4, 2, 4)
+    assert np.shares_memory(batch.control_points, library.blob)
+    assert np.array_equal(batch.control_points[1], library[3].control_points)
+    with pytest.raises(ValueError):
+        library[0].modify_control_point(0, [0, 0])
+
+def test_batch_mismatch(tmp_path):
+    path = tmp_path / 'curves.bbpi'
+    save_curves(path, [BezierCurve([1, 2, 3]), BezierCurve([1, 2])])
+    with pytest.raises(ValueError):
+        load_curves(path).to_batch()
+
+def test_not_a_library(tmp_path):
+    path = tmp_path / 'junk.bin'
+    path.write_bytes(b'not a curve library')
+    with pytest.raises(ValueError):
+        load_curves(path)
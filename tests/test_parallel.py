@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from bbpi import BezierCurve, BivariateBezierSurface
+from bbpi.bbparallel import ParallelExecutor
+
+rng = np.random.default_rng(0)
+curves = [BezierCurve(rng.random((2, d + 1))) for d in rng.integers(1, 8, 40)]
+surfaces = [BivariateBezierSurface(rng.random((d + 1, d + 1))) for d in (2, 3, 4)]
+t = np.linspace(0, 1, 50)
+u = rng.random(200) / 2
+v = rng.random(200) / 2
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_evaluate_curves(processes):
+    with ParallelExecutor(processes) as executor:
+        out = executor.evaluate_curves(curves, t)
+        assert np.allclose(out, np.stack([curve.evaluate(t) for curve in curves]))
+        assert np.allclose(executor.evaluate_curve(curves[0], t), curves[0].evaluate(t))
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_evaluate_surfaces(processes):
+    with ParallelExecutor(processes) as executor:
+        out = executor.evaluate_surfaces(surfaces, u, v)
+        assert np.allclose(out, np.stack([surface.evaluate(u, v) for surface in surfaces]))
+        assert np.allclose(executor.evaluate_surface(surfaces[1], u, v), surfaces[1].evaluate(u, v))
+
+def test_mixed_dimensions():
+    with pytest.raises(ValueError):
+        ParallelExecutor(1).evaluate_curves([BezierCurve([1, 2]), BezierCurve([[1, 2], [3, 4]])], t)
+
+def test_output_preallocated():
+    points = curves[0].control_points.astype(np.float64)
+    out = np.empty((2, t.shape[0]))
+    with ParallelExecutor(2) as executor:
+        assert executor._run('curve_grid', {'points': points, 't': t, 'out': out}, t.shape[0]) is out
+    assert np.allclose(out, curves[0].evaluate(t))
@@ -0,0 +1,38 @@
+import json
+import numpy as np
+from bbpi import BezierCurve, BivariateBezierSurface, add, multiply, bbprofile
+
+def test_disabled_records_nothing():
+    bbprofile.reset()
+    BezierCurve([1, 2, 3]).evaluate(np.linspace(0, 1, 5))
+    assert bbprofile.snapshot()['operations'] == {}
+
+def test_profiling_context():
+    curve = BezierCurve([[0, 1, 2, 3], [1, 0, 1, 0]])
+    surface = BivariateBezierSurface(np.ones((3, 3)))
+    with bbprofile.profiling() as stats:
+        curve.evaluate(np.linspace(0, 1, 50))
+        curve.evaluate(np.linspace(0, 1, 10))
+        add(curve, curve)
+        multiply(curve, BezierCurve([[1, 1], [2, 2]]))
+        surface.evaluate(np.zeros(7), np.zeros(7))
+    assert not bbprofile.is_enabled()
+    evaluate = stats['operations']['BezierCurve.evaluate']
+    assert evaluate['calls'] == 2
+    assert evaluate['samples_total'] == 60 and evaluate['samples_max'] == 50
+    assert evaluate['degree_max'] == 3 and evaluate['dimension_max'] == 2
+    assert evaluate['seconds'] >= evaluate['seconds_max'] > 0
+    assert stats['operations']['add']['calls'] == 1
+    assert stats['operations']['multiply']['degree_max'] == 3
+    assert stats['operations']['BivariateBezierSurface.evaluate']['samples_total'] == 7
+    assert 0 <= stats['caches']['curve_basis']['hit_rate'] <= 1
+    assert 'product_weights' in stats['caches']
+
+def test_export():
+    with bbprofile.profiling():
+        BezierCurve([1, 2, 3]).evaluate(0.5)
+    data = json.loads(bbprofile.export())
+    assert data['operations']['BezierCurve.evaluate']['calls'] == 1
+    text = bbprofile.export('prometheus')
+    assert 'bbpi_calls_total{operation="BezierCurve.evaluate"} 1' in text
+    assert 'bbpi_cache_hit_rate{cache="curve_basis"}' in text
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from bbpi import BezierCurve
+from bbpi.bb1query import nearest_point, intersect, CurveBVH
+from bbpi import split_at
+
+def brute_nearest(curve, point):
+    t = np.linspace(0, 1, 100001)
+    distance = np.linalg.norm(curve.evaluate(t) - np.asarray(point)[:, None], axis=0)
+    return t[distance.argmin()], distance.min()
+
+def test_nearest_point():
+    curve = BezierCurve([[0,1,2,3],[0,3,-3,0]])
+    for point in ([1.5,2], [0,5], [3,-1], [-1,-1]):
+        t, distance = nearest_point(curve, point)
+        t_brute, distance_brute = brute_nearest(curve, point)
+        assert distance <= distance_brute + 1e-12
+        assert abs(t - t_brute) < 1e-4
+
+def test_intersect():
+    curve1 = BezierCurve([[0,1,2,3],[0,3,-3,0]])
+    curve2 = BezierCurve([[0,3],[0.5,-0.5]])
+    hits = intersect(curve1, curve2)
+    assert len(hits) == 3
+    for t1, t2 in hits:
+        assert np.allclose(curve1.evaluate(t1), curve2.evaluate(t2), atol=1e-9)
+
+def test_intersect_disjoint():
+    curve1 = BezierCurve([[0,1,2],[0,1,0]])
+    curve2 = BezierCurve([[0,1,2],[2,3,2]])
+    assert intersect(curve1, curve2) == []
+
+def test_intersect_overlap():
+    curve = BezierCurve([[0,1,2,3],[0,3,-3,0]])
+    hits, overlaps = intersect(curve, curve, return_overlaps=True)
+    assert hits == [(0.0, 0.0), (1.0, 1.0)]
+    assert overlaps == [((0.0, 1.0), (0.0, 1.0))]
+
+    segment1 = BezierCurve([[0,2],[0,2]])
+    segment2 = BezierCurve([[3,1],[3,1]])
+    hits, overlaps = intersect(segment1, segment2, return_overlaps=True)
+    assert np.allclose(hits, [(0.5, 1.0), (1.0, 0.5)])
+    assert np.allclose(overlaps, [((0.5, 1.0), (1.0, 0.5))])
+
+    piece = split_at(curve, [0.3, 0.8])[1]
+    hits = intersect(curve, piece)
+    assert np.allclose(hits, [(0.3, 0.0), (0.8, 1.0)])
+
+def test_bvh():
+    rng = np.random.default_rng(0)
+    curves = [BezierCurve(rng.random((2,1)) * 20 + rng.random((2,4))) for _ in range(300)]
+    bvh = CurveBVH(curves)
+    point = [10.2, 9.7]
+    index, t, distance = bvh.nearest(point)
+    assert np.isclose(distance, min(nearest_point(curve, point)[1] for curve in curves))
+    assert len(bvh.query_box([10, 10], [10.5, 10.5])) < 10
+    line = BezierCurve([[5,15],[5,15]])
+    hits = bvh.intersect(line)
+    expected = sum(len(intersect(line, curve)) for curve in curves)
+    assert len(hits) == expected
+    for k, t, s in hits:
+        assert np.allclose(line.evaluate(t), curves[k].evaluate(s), atol=1e-9)
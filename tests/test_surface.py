@@ -0,0 +1,146 @@
+import numpy as np
+from sympy import symbols
+import pytest
+from bbpi import BivariateBezierSurface
+
+control_points = [
+    [1, 2, 3, 2, 1],
+    [2, 5, 7, 5, 2],
+    [3, 7, 10, 7, 3],
+    [2, 5, 7, 5, 2],
+    [1, 2, 3, 2, 1]
+]
+
+def test_evaluate_vectorized():
+    surface = BivariateBezierSurface(control_points)
+    u = np.array([0.0, 0.1, 0.25, 0.6])
+    v = np.array([0.0, 0.5, 0.25, 0.1])
+    eval = surface.evaluate(u, v)
+    expected = [float(surface._evaluate_symbolic(a, b)) for a, b in zip(u, v)]
+    assert eval.shape == (4,)
+    assert np.allclose(eval, expected)
+
+def test_evaluate_scalar():
+    surface = BivariateBezierSurface(control_points)
+    assert np.isclose(surface.evaluate(1.0, 0.0), 1)
+    assert np.isclose(surface.evaluate(0.0, 0.0), 1)
+
+def test_evaluate_grid_shape():
+    surface = BivariateBezierSurface(control_points)
+    U, V = np.meshgrid(np.linspace(0, 1, 5), np.linspace(0, 1, 3))
+    assert surface.evaluate(U, V).shape == (3, 5)
+
+def test_basis_cache_eviction():
+    from bbpi.bbcache import BasisCache
+    from bbpi.bb2surface import bernstein_matrix2
+    cache = BasisCache(maxsize=2)
+    grids = [(np.linspace(0, 0.5, n), np.linspace(0, 0.5, n)) for n in (30, 40, 50)]
+    for grid in grids:
+        cache.lookup(4, grid, bernstein_matrix2)
+    cache.lookup(4, grids[2], bernstein_matrix2)
+    cache.lookup(4, grids[0], bernstein_matrix2)
+    info = cache.info()
+    assert (info['hits'], info['misses'], info['size'], info['maxsize']) == (1, 4, 2, 2)
+    assert info['nbytes'] == sum(cache.lookup(4, grid, bernstein_matrix2).nbytes + 2 * grid[0].nbytes for grid in grids[::2])
+    assert np.allclose(cache.lookup(4, grids[1], bernstein_matrix2).sum(axis=1), 1)
+
+def test_iter_evaluate():
+    surface = BivariateBezierSurface(control_points)
+    u = np.linspace(0, 0.5, 1000)
+    v = np.linspace(0.5, 0, 1000)
+    out = np.empty(1000)
+    chunks = list(surface.iter_evaluate(u, v, chunk_size=128, out=out))
+    assert len(chunks) == 8
+    assert np.allclose(out, surface.evaluate(u, v))
+    assert np.allclose(np.concatenate(list(surface.iter_evaluate(iter(u), iter(v), chunk_size=100))), out)
+    # length mismatches on a chunk boundary
+    for a, b in ((np.zeros(10), np.zeros(8)), (np.zeros(8), np.zeros(10))):
+        with pytest.raises(ValueError):
+            list(surface.iter_evaluate(a, b, chunk_size=4))
+
+def test_compile_cache():
+    surface = BivariateBezierSurface(np.array(control_points, dtype=float))
+    u = np.array([0.1, 0.3])
+    v = np.array([0.2, 0.4])
+    compiled = surface.compile()
+    assert surface.compile() is compiled
+    assert np.allclose(compiled(u, v), surface.evaluate(u, v))
+    surface.modify_control_point(1, 1, 0.0)
+    assert surface.compile() is not compiled
+    assert np.allclose(surface.compile()(u, v), surface.evaluate(u, v))
+
+def test_modify_int_points():
+    from bbpi.bb2surface import triangle_grid
+    surface = BivariateBezierSurface([[1, 2, 3], [4, 5, 0], [6, 0, 0]])
+    samples = surface.sample(4)
+    surface.modify_control_point(0, 0, 0.5)
+    assert surface.control_points[0, 0] == 0.5
+    assert np.allclose(samples, surface.evaluate(*triangle_grid(4)))
+
+def test_pickle_after_compile():
+    import pickle
+    surface = BivariateBezierSurface(np.array(control_points, dtype=float))
+    surface.compile()
+    surface.sample(10)
+    copy = pickle.loads(pickle.dumps(surface))
+    assert copy._symbolic == {} and len(copy._samples) == 0
+    assert np.array_equal(copy.sample(10), surface.sample(10))
+
+def test_incremental_samples():
+    from bbpi.bb2surface import triangle_grid
+    surface = BivariateBezierSurface(np.array(control_points, dtype=float))
+    samples = surface.sample(10)
+    assert samples.shape == (66,)
+    surface.modify_control_point(1, 2, -4.0)
+    surface.modify_control_point(4, 4, 100.0)
+    with pytest.raises(ValueError):
+        surface.control_points[1, 2] = 5
+    assert np.allclose(samples, surface.evaluate(*triangle_grid(10)))
+
+def test_tessellate_level():
+    surface = BivariateBezierSurface(control_points)
+    vertices, indices = surface.tessellate(level=6)
+    assert vertices.shape == (28, 3) and indices.shape == (36, 3)
+    assert indices.dtype == np.int32
+    assert np.allclose(vertices[:, 2], surface.evaluate(vertices[:, 0], vertices[:, 1]))
+    # every edge inside the domain is shared by exactly two triangles
+    edges = np.sort(np.concatenate([indices[:, [0, 1]], indices[:, [1, 2]], indices[:, [2, 0]]]), axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    assert np.sum(counts == 1) == 3 * 6 and np.all(counts <= 2)
+    # counterclockwise in the (u, v) plane, covering the domain of area 1/2
+    e1 = vertices[indices[:, 1], :2] - vertices[indices[:, 0], :2]
+    e2 = vertices[indices[:, 2], :2] - vertices[indices[:, 0], :2]
+    area = (e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]) / 2
+    assert np.all(area > 0) and np.isclose(area.sum(), 0.5)
+    # a mesh is exported once, it does not keep sample buffers on the surface
+    assert len(surface._samples) == 0
+
+def test_tessellate_tolerance():
+    surface = BivariateBezierSurface(control_points)
+    tol = 1e-3
+    vertices, indices = surface.tessellate(tol=tol)
+    rng = np.random.default_rng(0)
+    weights = rng.dirichlet(np.ones(3), size=len(indices))
+    corners = vertices[indices]
+    points = np.einsum('tk,tkc->tc', weights, corners)
+    assert np.all(np.abs(surface.evaluate(points[:, 0], points[:, 1]) - points[:, 2]) <= tol)
+    with pytest.raises(ValueError):
+        surface.tessellate()
+
+def test_mesh_writers(tmp_path):
+    from bbpi import write_ply, write_obj
+    vertices, indices = BivariateBezierSurface(control_points).tessellate(level=3)
+    write_ply(tmp_path / 'mesh.ply', vertices, indices)
+    data = (tmp_path / 'mesh.ply').read_bytes()
+    header, body = data.split(b'end_header\n')
+    assert b'element vertex 10' in header and b'element face 9' in header
+    assert len(body) == 10 * 3 * 4 + 9 * 13
+    assert np.allclose(np.frombuffer(body[:120], dtype='<f4').reshape(10, 3), vertices)
+    faces = np.frombuffer(body[120:], dtype=[('count', 'u1'), ('indices', '<i4', (3,))])
+    assert np.array_equal(faces['indices'], indices) and np.all(faces['count'] == 3)
+
+    write_obj(tmp_path / 'mesh.obj', vertices, indices)
+    lines = (tmp_path / 'mesh.obj').read_text().splitlines()
+    v = np.array([line.split()[1:] for line in lines if line.startswith('v ')], dtype=float)
+    f = np.array([line.split()[1:] for line in lines if line.startswith('f ')], dtype=int)
+    assert np.allclose(v, vertices) and np.array_equal(f - 1, indices)
@@ -1,10 +1,11 @@
 import numpy as np
 from sympy import symbols
 import pytest
+from fractions import Fraction
 from bbpi import BezierCurve
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-from bbpi import add, multiply, degree_raise, subdivide, derivative
+from bbpi import add, multiply, degree_raise, elevate, reduce_degree, subdivide, split_at, derivative, flatten
 
 def test_add():
 
@@ -46,4 +47,119 @@ def test_derivative():
 
     derivative(curve)
     print(curve.control_points)
-    assert True
\ No newline at end of file
+    assert True
+def test_multiply_numeric():
+    curve1 = BezierCurve([[1,2,3],[0,-1,4]])
+    curve2 = BezierCurve([[1,1],[2,-3]])
+    product = multiply(curve1, curve2)
+    assert product.control_points.dtype == np.float64
+    t = np.linspace(0, 1, 11)
+    assert np.allclose(product.evaluate(t), curve1.evaluate(t) * curve2.evaluate(t))
+
+def test_multiply_exact_lo_hi():
+    with pytest.raises(ValueError):
+        multiply(BezierCurve([1, 2]), BezierCurve([3, 4]), lo=0, hi=0, exact=True)
+
+def test_multiply_symbolic():
+    curve1 = BezierCurve([symbols('a_0'), symbols('a_1')])
+    curve2 = BezierCurve([1, 1])
+    product = multiply(curve1, curve2)
+    assert product.control_points[0][1] == (symbols('a_0') + symbols('a_1')) / 2
+    a, b = symbols('a b')
+    product = multiply(BezierCurve([a, b, 1]), BezierCurve([1, 2]))
+    assert not any(isinstance(x, Fraction) for x in product.control_points.flat)
+    assert product.control_points[0][-1] == 2
+
+def test_flatten_line():
+    curve = BezierCurve([[0,1,2,3],[0,1,2,3]])
+    assert flatten(curve, tol=1e-6).shape == (2, 2)
+
+def test_flatten_tolerance():
+    curve = BezierCurve([[0,0,4,4],[0,3,3,0]])
+    tol = 1e-3
+    points, params = flatten(curve, tol=tol, return_params=True)
+    assert np.allclose(points, curve.evaluate(params))
+    assert params[0] == 0 and params[-1] == 1 and np.all(np.diff(params) > 0)
+    # the curve between two vertices stays within tol of the chord joining them
+    for k in range(points.shape[1] - 1):
+        t = np.linspace(params[k], params[k + 1], 9)
+        samples = curve.evaluate(t)
+        a, b = points[:, k:k+1], points[:, k+1:k+2]
+        s = np.clip(((samples - a) * (b - a)).sum(0) / ((b - a)**2).sum(), 0, 1)
+        assert np.all(np.linalg.norm(samples - (a + s * (b - a)), axis=0) <= tol)
+    assert points.shape[1] < 200
+
+def test_subdivide_all_dimensions():
+    curve = BezierCurve([[0,1,3,4],[0,2,2,0],[1,0,0,1]])
+    left, right = subdivide(curve, 0.25)
+    t = np.linspace(0, 1, 7)
+    assert np.allclose(left.evaluate(t), curve.evaluate(0.25 * t))
+    assert np.allclose(right.evaluate(t), curve.evaluate(0.25 + 0.75 * t))
+
+def test_split_at():
+    curve = BezierCurve([[0,1,3,4],[0,2,2,0]])
+    ts = [0.1, 0.5, 0.5, 0.8]
+    pieces = split_at(curve, ts)
+    assert len(pieces) == 5
+    t = np.linspace(0, 1, 5)
+    for piece, a, b in zip(pieces, [0] + ts, ts + [1]):
+        assert np.allclose(piece.evaluate(t), curve.evaluate(a + (b - a) * t))
+    with pytest.raises(ValueError):
+        split_at(curve, [0.5, 0.2])
+
+def test_exact_backend():
+    curve1 = BezierCurve([[1, Fraction(1, 3), 2], [0, 5, Fraction(-2, 7)]])
+    curve2 = BezierCurve([[Fraction(1, 3), 0, 1], [1, 1, 1]])
+    product = multiply(curve1, curve2, exact=True)
+    assert product.control_points.dtype == object
+    assert all(isinstance(x, Fraction) for x in product.control_points.ravel())
+    assert product.control_points[0, 1] == Fraction(1, 2) * 1 * 0 + Fraction(1, 2) * Fraction(1, 3) * Fraction(1, 3)
+    assert np.allclose(product.control_points.astype(float), multiply(curve1, curve2).control_points.astype(float))
+    assert add(curve1, curve2, exact=True).control_points[0, 0] == Fraction(4, 3)
+
+    raised = degree_raise(curve1, exact=True)
+    assert raised.control_points[0, 1] == Fraction(1, 3) + Fraction(2, 3) * Fraction(1, 3)
+    left, right = subdivide(raised, Fraction(1, 3), exact=True)
+    assert left.control_points[:, -1].tolist() == right.control_points[:, 0].tolist()
+    back = split_at(raised, [Fraction(1, 3)])[0].control_points.astype(float)
+    assert np.allclose(left.control_points.astype(float), back)
+    assert derivative(BezierCurve([1, Fraction(1, 2), 3]), exact=True).control_points.tolist() == [[-1, 5]]
+
+    with pytest.raises(TypeError):
+        add(BezierCurve([symbols('a'), 1]), BezierCurve([1, 1]), exact=True)
+
+def test_elevate_and_reduce():
+    curve = BezierCurve([[0, 1, 3, 4], [0, 2, 2, 0]])
+    t = np.linspace(0, 1, 11)
+    elevated = elevate(curve, 4)
+    assert elevated.degree == 7
+    assert np.allclose(elevated.evaluate(t), curve.evaluate(t))
+    assert np.allclose(elevated.control_points, degree_raise(degree_raise(degree_raise(degree_raise(curve)))).control_points)
+    assert np.allclose(reduce_degree(elevated, 4).control_points, curve.control_points)
+
+    exact = elevate(BezierCurve([0, 1, 3]), 2, exact=True)
+    assert exact.control_points.tolist() == [[0, Fraction(1, 2), Fraction(7, 6), 2, 3]]
+
+    # least squares: the best line for 2t(1 - t) over [0, 1] is its mean 1/3
+    line = reduce_degree(BezierCurve([0, 1, 0]))
+    assert np.allclose(line.control_points, [[1 / 3, 1 / 3]])
+    with pytest.raises(ValueError):
+        reduce_degree(line, 2)
+
+def test_reduce_high_degree():
+    curve = BezierCurve(np.random.default_rng(2).random((2, 26)))
+    assert np.allclose(reduce_degree(elevate(curve, 3), 3).control_points, curve.control_points, rtol=0, atol=1e-12)
+    # the reduction of degree n to 0 is the mean of the coefficients
+    assert np.allclose(reduce_degree(BezierCurve([[0, 1, 2, 3, 4]]), 4).control_points, 2)
+    curve = BezierCurve(np.random.default_rng(3).random((1, 61)))
+    assert np.allclose(reduce_degree(elevate(curve, 3), 3).control_points, curve.control_points, rtol=0, atol=1e-12)
+
+def test_add_mixed_degrees():
+    curve1 = BezierCurve([[0, 1], [1, 1]])
+    curve2 = BezierCurve([[0, 2, 0, 1], [1, 0, 1, 0]])
+    t = np.linspace(0, 1, 9)
+    total = add(curve1, curve2)
+    assert total.degree == 3
+    assert np.allclose(total.evaluate(t), curve1.evaluate(t) + curve2.evaluate(t))
+    a = symbols('a')
+    assert add(BezierCurve([a, 1]), BezierCurve([0, 0, 0])).control_points[0, 1] == a / 2 + Fraction(1, 2)